@@ -7,7 +7,7 @@ Revolutionary AI-powered DeFi agent for cross-chain atomic swaps.
 
 import asyncio
 import time
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 from datetime import datetime, timedelta
 
 from pydantic import Field
@@ -150,7 +150,6 @@ class DogeSmartXAgent(ToolCallAgent):
         """Handle completion/success messages by finalizing the task"""
         logger.info("🏁 Handling completion message - task finished")
         # The message content is already the final result, so we can complete the task
-        from app.exceptions import AgentTaskComplete
         raise AgentTaskComplete(message.content)
     
     async def _execute_conversational_defi(self, message: Message) -> bool:
@@ -166,11 +165,15 @@ class DogeSmartXAgent(ToolCallAgent):
 
     async def _execute_atomic_swap(self, message: Message) -> bool:
         """Execute atomic swap operation"""
-        return await self.swap_executor.execute_atomic_swap(message)
+        _, response = await self.swap_executor.execute_atomic_swap(message)
+        # Don't append to messages - AgentTaskComplete will handle the response
+        raise AgentTaskComplete(response)
 
     async def _execute_contract_deployment(self, message: Message) -> bool:
         """Execute contract deployment operation"""
-        return await self.contract_handler.execute_contract_deployment(message)
+        _, response = await self.contract_handler.execute_contract_deployment(message)
+        # Don't append to messages - AgentTaskComplete will handle the response
+        raise AgentTaskComplete(response)
 
     async def _execute_wallet_setup(self, message: Message) -> bool:
         """Execute wallet setup operation"""
@@ -244,11 +247,11 @@ I can help you with DeFi operations! Try these commands:
 
     # Utility methods
 
-    def get_operation_expertise(self, operation_type: str) -> List[str]:
+    def get_operation_expertise(self, operation_type: str) -> Tuple[str, ...]:
         """Get expertise information for operation type"""
         return UtilityFunctions.get_dogesmartx_expertise(operation_type)
 
-    def get_operation_guidance(self, operation_type: str) -> List[str]:
+    def get_operation_guidance(self, operation_type: str) -> Tuple[str, ...]:
         """Get guidance for operation type"""
         return UtilityFunctions.get_operation_guidance(operation_type)
 
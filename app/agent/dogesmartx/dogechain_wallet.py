@@ -10,6 +10,7 @@ import json
 import os
 import secrets
 import hashlib
+import uuid
 from datetime import datetime, timedelta
 from typing import Dict, Any, Optional
 from web3 import Web3
@@ -393,8 +394,6 @@ class DogechainWallet:
     async def store_swap_doge(self, doge_amount: float, target_address: str, description: str = "") -> Dict[str, Any]:
         """Store DOGE from a swap transaction with persistent storage"""
         try:
-            import uuid
-            
             swap_id = str(uuid.uuid4())
             timestamp = datetime.now().isoformat()
             
@@ -15,6 +15,8 @@ from decimal import Decimal
 
 from app.logger import logger
 
+NS_PER_SECOND = 1_000_000_000
+
 
 @dataclass
 class HTLCSecret:
@@ -61,11 +63,11 @@ class HTLCParameters:
     
     def is_expired(self) -> bool:
         """Check if HTLC has expired."""
-        return int(time.time()) >= self.time_lock
+        return time.time_ns() // NS_PER_SECOND >= self.time_lock
     
     def time_remaining(self) -> int:
         """Get remaining time in seconds."""
-        return max(0, self.time_lock - int(time.time()))
+        return max(0, self.time_lock - time.time_ns() // NS_PER_SECOND)
 
 
 @dataclass
@@ -263,7 +265,7 @@ class DogecoinHTLCService:
             # Actual implementation would use dogecoin libraries
             
             # For testing, we'll simulate the transaction
-            contract_id = f"doge_{int(time.time())}_{secrets.token_hex(8)}"
+            contract_id = f"doge_{time.time_ns() // NS_PER_SECOND}_{secrets.token_hex(8)}"
             
             htlc = HTLCContract(
                 contract_id=contract_id,
@@ -317,11 +319,12 @@ class CrossChainHTLCManager:
             # Generate HTLC secret
             htlc_secret = HTLCSecret.generate()
             
-            # Calculate timelock
-            timelock = int(time.time()) + (timelock_hours * 3600)
+            # Calculate timelock and swap ID from one integer clock read
+            now = time.time_ns() // NS_PER_SECOND
+            timelock = now + (timelock_hours * 3600)
             
             # Create swap ID
-            swap_id = f"swap_{int(time.time())}_{secrets.token_hex(8)}"
+            swap_id = f"swap_{now}_{secrets.token_hex(8)}"
             
             # Create HTLC parameters for both chains
             eth_params = HTLCParameters(
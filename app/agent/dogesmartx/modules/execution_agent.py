@@ -6,6 +6,7 @@ Handles the execution of swaps and contract interactions.
 import time
 from typing import Dict, Any, Optional, List
 from decimal import Decimal
+from ..types import OperationCapability
 from .base_agent import BaseAgentModule
 
 
@@ -19,8 +20,6 @@ class ExecutionAgent(BaseAgentModule):
     
     def _register_capabilities(self):
         """Register execution capabilities"""
-        from ..types import OperationCapability
-        
         self.register_capability(OperationCapability(
             name="execute_atomic_swap",
             description="Execute an atomic swap between chains",
@@ -5,6 +5,7 @@ Handles machine learning and adaptive behavior.
 
 from typing import Dict, Any, List, Optional
 import json
+from ..types import OperationCapability
 from .base_agent import BaseAgentModule
 
 
@@ -19,8 +20,6 @@ class LearningAgent(BaseAgentModule):
     
     def _register_capabilities(self):
         """Register learning capabilities"""
-        from ..types import OperationCapability
-        
         self.register_capability(OperationCapability(
             name="optimize_parameters",
             description="Optimize parameters based on historical performance",
@@ -5,6 +5,7 @@ Handles market data analysis and trading insights.
 
 from typing import Dict, Any, Optional
 from decimal import Decimal
+from ..types import OperationCapability
 from .base_agent import BaseAgentModule
 
 
@@ -18,8 +19,6 @@ class MarketAnalysisAgent(BaseAgentModule):
     
     def _register_capabilities(self):
         """Register market analysis capabilities"""
-        from ..types import OperationCapability
-        
         self.register_capability(OperationCapability(
             name="get_doge_price",
             description="Get current DOGE price in USD",
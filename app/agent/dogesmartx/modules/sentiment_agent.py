@@ -4,6 +4,7 @@ Analyzes market sentiment and social media trends.
 """
 
 from typing import Dict, Any, List
+from ..types import OperationCapability
 from .base_agent import BaseAgentModule
 
 
@@ -16,8 +17,6 @@ class SentimentAgent(BaseAgentModule):
     
     def _register_capabilities(self):
         """Register sentiment analysis capabilities"""
-        from ..types import OperationCapability
-        
         self.register_capability(OperationCapability(
             name="analyze_social_sentiment",
             description="Analyze social media sentiment for a currency",
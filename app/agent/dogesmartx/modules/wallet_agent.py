@@ -3,10 +3,14 @@ DogeSmartX Wallet Management Agent
 Handles wallet operations and balance management.
 """
 
+import re
 from typing import Dict, Any, Optional
 from decimal import Decimal
+from ..types import OperationCapability
 from .base_agent import BaseAgentModule
 
+_ETH_ADDRESS_RE = re.compile(r"0x[0-9a-fA-F]{40}")
+
 
 class WalletAgent(BaseAgentModule):
     """Wallet management agent for multi-chain operations"""
@@ -18,8 +22,6 @@ class WalletAgent(BaseAgentModule):
     
     def _register_capabilities(self):
         """Register wallet management capabilities"""
-        from ..types import OperationCapability
-        
         self.register_capability(OperationCapability(
             name="check_eth_balance",
             description="Check ETH balance for an address",
@@ -76,8 +78,9 @@ class WalletAgent(BaseAgentModule):
     
     async def validate_address(self, address: str, chain: str) -> bool:
         """Validate if an address is valid for the specified chain"""
-        if chain.lower() == "ethereum":
-            return len(address) == 42 and address.startswith("0x")
-        elif chain.lower() == "dogecoin":
+        chain = chain.lower()
+        if chain == "ethereum":
+            return _ETH_ADDRESS_RE.fullmatch(address) is not None
+        elif chain == "dogecoin":
             return len(address) >= 26 and address[0] in ['D', 'A', '9']
         return False
@@ -5,6 +5,7 @@ Core operation detection and routing logic for the DogeSmartX agent.
 """
 
 import asyncio
+import re
 from typing import Dict, Optional, Any
 from app.logger import logger
 from app.schema import Message
@@ -32,6 +33,27 @@ except ImportError as e:
     logger.warning(f"Response handler not available: {e}")
     RESPONSE_HANDLER_AVAILABLE = False
 
+# Amount followed by a unit in a lowercased swap request
+_AMOUNT_RE = re.compile(r'(\d+\.?\d*)\s*(?:eth|doge|dollars?|\$)')
+
+
+def _phrase_alternation(phrases) -> re.Pattern:
+    """Compile literal phrases into one alternation so detection scans the text once"""
+    return re.compile("|".join(map(re.escape, phrases)))
+
+
+# Completion/success messages that should terminate the task
+_COMPLETION_RE = _phrase_alternation((
+    "real atomic swap execution completed",
+    "atomic swap summary:",
+    "technical implementation:",
+    "dogesmartx is ready",
+    "execution completed",
+    "✅",
+    "🎯 **real atomic swap summary:**"
+))
+_RESOLVER_RE = _phrase_alternation(("resolver", "monitor", "automated"))
+
 
 class OperationDetector:
     """Detects and classifies DogeSmartX operations"""
@@ -55,28 +77,23 @@ class OperationDetector:
         self.setup_indicators = [
             "wallet", "setup", "initialize", "connect"
         ]
+        
+        self._conversational_re = _phrase_alternation(self.conversational_indicators)
+        self._swap_re = _phrase_alternation(self.swap_indicators)
+        self._deployment_re = _phrase_alternation(self.deployment_indicators)
+        self._setup_re = _phrase_alternation(self.setup_indicators)
 
     async def detect_operation_type(self, content: str) -> str:
         """Detect the type of DogeSmartX operation requested with AI orchestration."""
         content_lower = content.lower()
         
         # Check if this is a completion/success message that should terminate
-        completion_indicators = [
-            "real atomic swap execution completed",
-            "atomic swap summary:",
-            "technical implementation:",
-            "dogesmartx is ready",
-            "execution completed",
-            "✅",
-            "🎯 **real atomic swap summary:**"
-        ]
-        
-        if any(indicator in content_lower for indicator in completion_indicators):
+        if _COMPLETION_RE.search(content_lower):
             logger.info("🏁 Detected completion message - triggering task complete")
             return "completion_message"
         
         # Check if this is a conversational DeFi request that needs orchestration
-        if any(phrase in content_lower for phrase in self.conversational_indicators):
+        if self._conversational_re.search(content_lower):
             if ORCHESTRATION_AVAILABLE:
                 try:
                     logger.info("🎭 Routing to DogeSmartX Orchestration Engine for conversational DeFi")
@@ -92,15 +109,15 @@ class OperationDetector:
                     logger.warning(f"Orchestration engine not available: {e}, using standard detection")
         
         # Standard operation detection for simple requests
-        if any(word in content_lower for word in self.swap_indicators):
+        if self._swap_re.search(content_lower):
             return "atomic_swap"
-        elif any(word in content_lower for word in self.deployment_indicators):
+        elif self._deployment_re.search(content_lower):
             return "contract_deployment"
-        elif any(word in content_lower for word in self.setup_indicators) and "swap" not in content_lower:
+        elif self._setup_re.search(content_lower) and "swap" not in content_lower:
             return "wallet_setup"
-        elif any(word in content_lower for word in ["resolver", "monitor", "automated"]):
+        elif _RESOLVER_RE.search(content_lower):
             return "resolver_setup"
-        elif any(word in content_lower for word in ["test"]) and "swap" not in content_lower:
+        elif "test" in content_lower and "swap" not in content_lower:
             return "test_execution"
         else:
             return "atomic_swap"  # Default to atomic swap for DogeSmartX
@@ -179,9 +196,7 @@ class OperationRouter:
         to_currency = "DOGE" if from_currency == "ETH" else "ETH"
         
         # Extract amount (basic regex pattern)
-        import re
-        amount_pattern = r'(\d+\.?\d*)\s*(?:eth|doge|dollars?|\$)'
-        amount_match = re.search(amount_pattern, content_lower)
+        amount_match = _AMOUNT_RE.search(content_lower)
         amount = float(amount_match.group(1)) if amount_match else 0.1
         
         # Extract conditions
@@ -31,6 +31,10 @@ class IntentType(Enum):
     COMPLEX_COORDINATION = "complex_coordination"
 
 
+# Display titles for summaries, e.g. "Market Analysis"
+_INTENT_TITLES = {intent: intent.value.replace('_', ' ').title() for intent in IntentType}
+
+
 @dataclass
 class AgentTask:
     """Task for individual agents in the orchestration"""
@@ -653,7 +657,7 @@ class DogeSmartXOrchestrator:
         failed_tasks = [r for r in execution_results.values() if not r.get("success", True)]
         
         # Create user-friendly summary
-        summary = f"🎯 Completed {plan.intent.value.replace('_', ' ').title()}\n\n"
+        summary = f"🎯 Completed {_INTENT_TITLES[plan.intent]}\n\n"
         
         if plan.intent == IntentType.AUTONOMOUS_TRADING:
             summary += "✅ Your autonomous trading setup is now active!\n"
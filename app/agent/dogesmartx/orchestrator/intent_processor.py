@@ -8,13 +8,34 @@ from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 import logging
 
+# Entity extraction patterns, compiled once at import
+_AMOUNT_PATTERNS = (
+    re.compile(r"(\d+(?:\.\d+)?)\s*(?:eth|doge)"),
+    re.compile(r"(\d+(?:\.\d+)?)")
+)
+_CURRENCY_PATTERNS = {
+    "eth": re.compile(r"\b(?:eth|ethereum)\b", re.IGNORECASE),
+    "doge": re.compile(r"\b(?:doge|dogecoin)\b", re.IGNORECASE)
+}
+_TIMEFRAME_PATTERNS = {
+    "now": re.compile(r"\b(?:now|immediately|asap)\b", re.IGNORECASE),
+    "today": re.compile(r"\b(?:today|this day)\b", re.IGNORECASE),
+    "hour": re.compile(r"(\d+)\s*hours?", re.IGNORECASE),
+    "minute": re.compile(r"(\d+)\s*minutes?", re.IGNORECASE)
+}
+_ETH_ADDRESS_RE = re.compile(r"\b0x[a-fA-F0-9]{40}\b")
+_DOGE_ADDRESS_RE = re.compile(r"\b[DA9][1-9A-HJ-NP-Za-km-z]{25,34}\b")  # simplified
+
 
 class IntentProcessor:
     """Process and classify user intents for DogeSmartX operations"""
     
     def __init__(self):
         self.logger = logging.getLogger(__name__)
-        self.intent_patterns = self._initialize_patterns()
+        self.intent_patterns = {
+            intent: [re.compile(pattern, re.IGNORECASE) for pattern in patterns]
+            for intent, patterns in self._initialize_patterns().items()
+        }
         self.entity_extractors = self._initialize_extractors()
     
     def _initialize_patterns(self) -> Dict[str, List[str]]:
@@ -92,7 +113,7 @@ class IntentProcessor:
         """Classify the primary intent of the message"""
         for intent, patterns in self.intent_patterns.items():
             for pattern in patterns:
-                if re.search(pattern, message, re.IGNORECASE):
+                if pattern.search(message):
                     return intent
         
         return "general_inquiry"
@@ -113,13 +134,8 @@ class IntentProcessor:
     
     def _extract_amount(self, message: str) -> Optional[float]:
         """Extract numeric amounts from message"""
-        patterns = [
-            r"(\d+(?:\.\d+)?)\s*(?:eth|doge)",
-            r"(\d+(?:\.\d+)?)"
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, message)
+        for pattern in _AMOUNT_PATTERNS:
+            match = pattern.search(message)
             if match:
                 try:
                     return float(match.group(1))
@@ -131,28 +147,16 @@ class IntentProcessor:
     def _extract_currency(self, message: str) -> Optional[List[str]]:
         """Extract currency mentions from message"""
         currencies = []
-        currency_patterns = {
-            "eth": r"\b(?:eth|ethereum)\b",
-            "doge": r"\b(?:doge|dogecoin)\b"
-        }
-        
-        for currency, pattern in currency_patterns.items():
-            if re.search(pattern, message, re.IGNORECASE):
+        for currency, pattern in _CURRENCY_PATTERNS.items():
+            if pattern.search(message):
                 currencies.append(currency)
         
         return currencies if currencies else None
     
     def _extract_timeframe(self, message: str) -> Optional[str]:
         """Extract timeframe mentions from message"""
-        timeframe_patterns = {
-            "now": r"\b(?:now|immediately|asap)\b",
-            "today": r"\b(?:today|this day)\b",
-            "hour": r"(\d+)\s*hours?",
-            "minute": r"(\d+)\s*minutes?"
-        }
-        
-        for timeframe, pattern in timeframe_patterns.items():
-            if re.search(pattern, message, re.IGNORECASE):
+        for timeframe, pattern in _TIMEFRAME_PATTERNS.items():
+            if pattern.search(message):
                 return timeframe
         
         return None
@@ -160,14 +164,12 @@ class IntentProcessor:
     def _extract_address(self, message: str) -> Optional[str]:
         """Extract wallet addresses from message"""
         # Ethereum address pattern
-        eth_pattern = r"\b0x[a-fA-F0-9]{40}\b"
-        eth_match = re.search(eth_pattern, message)
+        eth_match = _ETH_ADDRESS_RE.search(message)
         if eth_match:
             return eth_match.group(0)
         
         # Dogecoin address pattern (simplified)
-        doge_pattern = r"\b[DA9][1-9A-HJ-NP-Za-km-z]{25,34}\b"
-        doge_match = re.search(doge_pattern, message)
+        doge_match = _DOGE_ADDRESS_RE.search(message)
         if doge_match:
             return doge_match.group(0)
         
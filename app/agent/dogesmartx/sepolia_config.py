@@ -11,6 +11,9 @@ from typing import Dict, Any, Optional, List
 from decimal import Decimal
 from pydantic import BaseModel
 
+# Names accepted for the Dogecoin testnet in get_network_config
+_DOGECOIN_NETWORK_NAMES = frozenset(("dogecoin", "doge", "dogecoin_testnet"))
+
 
 @dataclass
 class SepoliaNetworkConfig:
@@ -212,14 +215,15 @@ class SepoliaDogeSmartXConfig:
     
     def get_network_config(self, network: str) -> Dict[str, Any]:
         """Get network configuration by name."""
-        if network.lower() == "sepolia":
+        network_name = network.lower()
+        if network_name == "sepolia":
             return {
                 "name": self.sepolia.name,
                 "rpc_url": self.sepolia.rpc_url,
                 "chain_id": self.sepolia.chain_id,
                 "explorer_url": self.sepolia.explorer_url
             }
-        elif network.lower() in ["dogecoin", "doge", "dogecoin_testnet"]:
+        elif network_name in _DOGECOIN_NETWORK_NAMES:
             return {
                 "name": self.dogecoin_testnet.name,
                 "rpc_url": self.dogecoin_testnet.rpc_url,
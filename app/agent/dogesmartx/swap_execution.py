@@ -5,72 +5,256 @@ High-level swap execution handlers for the DogeSmartX atomic swaps between ETH a
 """
 
 import asyncio
+import copy
+import functools
+import hashlib
+import json
+import os
+import re
+import secrets
+import sys
 import time
-from typing import Dict, Any
+from datetime import datetime
+from decimal import Decimal
+from typing import Dict, Any, List, Optional, Tuple
 from app.logger import logger
 from app.schema import Message
-from app.exceptions import AgentTaskComplete
-from app.tool.python_execute import PythonExecute
-from .types import OperationResult
+from .types import DEFAULT_SEPOLIA_RPCS, SEPOLIA_CHAIN_ID, OperationResult, SwapRequest
 from .operations import ORCHESTRATION_AVAILABLE, process_conversational_request
 
-async def execute_real_swap():
-    """Execute real atomic swap with enhanced capabilities"""
-    print("🚀 DogeSmartX REAL Atomic Swap Execution")
-    print("=" * 70)
+# Seconds to wait on orchestration before falling back to the standard swap
+ORCHESTRATION_TIMEOUT = 2.0
+
+# Phrases marking a swap request that benefits from orchestration
+COMPLEX_SWAP_INDICATORS = (
+    "when it's good", "optimal timing", "market conditions", "best time",
+    "analyze and swap", "intelligent swap", "automated swap", "monitor and execute"
+)
+_COMPLEX_SWAP_RE = re.compile("|".join(map(re.escape, COMPLEX_SWAP_INDICATORS)), re.IGNORECASE)
+
+# Swap intent sits at the start of a request; don't scan pasted payloads after it
+COMPLEX_SWAP_SCAN_CHARS = 512
+
+# Seconds a successful orchestration result is reused for an identical request;
+# kept short so market-sensitive decisions don't go stale
+ORCHESTRATION_CACHE_TTL = 60.0
+
+_orchestration_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+
+# Only informational intents are cached; replaying an execution result would
+# report a success for work that was never done
+_CACHEABLE_INTENTS = frozenset({"market_analysis", "learning_request"})
+
+# Testnet recipients of the demo swap; the ETH side is the funded wallet
+ETH_RECIPIENT = "0xb9966f1007e4ad3a37d29949162d68b0df8eb51c"
+DOGE_RECIPIENT = "nfLXEYM5EGRHhqrR9FzPKD7sBSQ3v5dj8s"
+
+# Dogecoin mainnet address DOGE is bridged to via 1inch Fusion
+DOGE_MAINNET_TARGET = "D7MPeVvsVrQYBkVRRMrkHEJrpVHoRvEr4G"
+
+# Wallet whose balance the deployment analysis reports
+DEPLOYMENT_FUNDED_WALLET = "0xb9966f1007E4aD3A37D29949162d68b0dF8Eb51c"
+
+# Seconds to wait on a single Sepolia JSON-RPC request
+RPC_TIMEOUT = 10
+
+WEI_PER_ETH = Decimal(10) ** 18
+WEI_PER_GWEI = Decimal(10) ** 9
+
+# Seconds gas price and latest block reads are reused; about one Sepolia block
+RPC_STATE_TTL = 12.0
+
+# Read-only JSON-RPC methods cached per endpoint, and those that never change
+_CACHED_RPC_METHODS = ("eth_chainId", "eth_getBlockByNumber", "eth_gasPrice")
+_CONSTANT_RPC_METHODS = ("eth_chainId",)
+
+# Response bodies; only the {}-slots vary per call
+_SWAP_RESPONSE_TEMPLATE = """🚀 **REAL Atomic Swap Execution Completed!**
+════════════════════════════════════════════════════════════════
+
+{swap_output}
+
+{doge_storage_result}
+
+🎯 **Real Atomic Swap Summary:**
+• ✅ Real swap logic executed successfully
+• 🔷 ETH HTLC deployment tested (Sepolia testnet)
+• 🐕 DOGE HTLC creation implemented with real scripts
+• 🔐 Cryptographic security verified
+• ⏰ Timelock protection activated
+• 💾 **DOGE permanently stored in Dogechain Testnet wallet**
+
+🔧 **Technical Implementation:**
+• Real Web3 connection to Sepolia testnet
+• Actual HTLC smart contract deployment capability
+• Enhanced Dogecoin HTLC with realistic OP codes
+• Secret generation and hash verification
+• Gas estimation and balance checking
+• **Real DOGE storage on Dogechain Testnet**
+
+💰 **Your Funded Wallet Integration:**
+• Address: {wallet_address}
+• Balance verification: {wallet_balance}
+• Ready for real HTLC deployment with private key
+
+🎯 **To Execute Real Swaps:**
+1. 🔑 Provide your private key securely
+2. 🚀 Deploy actual HTLC contracts on Sepolia
+3. 🔍 Monitor transactions on Etherscan
+4. ⚡ Complete cross-chain atomic swaps
+
+✨ **DogeSmartX is ready for REAL atomic swaps with persistent DOGE storage!**
+"""
+
+_DEPLOYMENT_RESPONSE_TEMPLATE = """🚀 **REAL Contract Deployment Analysis Completed!**
+════════════════════════════════════════════════════════════════
+
+{deployment_output}
+
+🎯 **Deployment Summary:**
+• ✅ Sepolia testnet connectivity verified
+• 🔧 Real Web3 integration tested
+• ⛽ Gas estimation performed
+• 💰 Wallet balance verification
+• 🔨 HTLC contract specifications confirmed
+
+🔧 **Technical Capabilities:**
+• Real contract deployment on Sepolia testnet
+• HTLC with hash and time locks
+• Atomic swap functionality
+• Secure refund mechanisms
+• Gas optimization strategies
+
+💡 **Next Steps for Real Deployment:**
+1. 🔑 Provide your funded wallet private key
+2. 🚀 Deploy actual HTLC smart contract
+3. 🔍 Monitor deployment on Etherscan
+4. ⚡ Execute real atomic swaps
+
+✨ **DogeSmartX is ready for REAL contract deployment!**
+"""
+
+# Constant blocks of the Dogechain storage report
+_DOGECHAIN_SEPARATOR = "═" * 51
+_DOGECHAIN_INTEGRATION_HEADER = "🐕 **REAL Dogechain Testnet Integration:**\n" + _DOGECHAIN_SEPARATOR
+_LOCAL_TRACKING_HEADER = "📊 **Local Tracking:**\n" + _DOGECHAIN_SEPARATOR
+_LOCAL_TRACKING_FOOTER = "\n".join((
+    "• � **DUAL MODE**: Real blockchain + Local tracking",
+    "• 🔗 RPC: https://rpc-testnet.dogechain.dog",
+))
+_FUSION_BRIDGE_HEADER = "🌉 **1inch Fusion Bridge Available:**\n" + _DOGECHAIN_SEPARATOR
+_FUSION_BRIDGE_FEATURES = "\n".join((
+    "• 🔄 Route: Dogechain Testnet → Dogecoin Mainnet",
+    "• ⚡ Cross-chain atomic swap technology",
+    "• 🛡️ Secure and decentralized bridging",
+    "• 📱 Execute bridge: Use 1inch Fusion interface",
+))
+_MAINNET_BRIDGE_BLOCK = "\n".join((
+    "🎯 **Your Dogecoin Mainnet Address:**",
+    f"• 📍 Target: {DOGE_MAINNET_TARGET}",
+    "• 🌉 Bridge via 1inch Fusion for cross-chain transfer",
+    "• ⏰ Estimated time: 5-15 minutes",
+    "• 💸 Bridge fee: ~0.1%",
+    "",
+))
+
+_rpc_session = None
+_rpc_state_cache: Dict[Tuple[str, str], Tuple[float, Any]] = {}
+
+
+def _orchestration_cache_key(user_input: str, context: Dict[str, Any]) -> str:
+    """Hash the request text and its context into a compact cache key"""
+    digest = hashlib.blake2b(user_input.encode(), digest_size=16)
+    for key, value in sorted(context.items()):
+        digest.update(f"\0{key}={value}".encode())
+    return digest.hexdigest()
+
+
+async def _cached_conversational_request(user_input: str, context: Dict[str, Any]) -> Dict[str, Any]:
+    """Run orchestration, reusing a recent successful result for identical requests"""
+    key = _orchestration_cache_key(user_input, context)
+    now = time.monotonic()
     
-    try:
-        # Initialize DogeSmartX wallet
-        wallet = DogeSmartXWallet(testnet_mode=True)
-        
-        # Use dynamic amounts from user request
-        eth_amount = {eth_amount}  # {eth_amount} ETH from user request
-        doge_amount = {doge_amount}  # {doge_amount} DOGE calculated'''
-    except Exception as e:
-        print(f"Error during swap execution: {e}")
-        raise
+    cached = _orchestration_cache.get(key)
+    if cached and now - cached[0] < ORCHESTRATION_CACHE_TTL:
+        logger.info("♻️ Reusing cached orchestration result")
+        # Callers may mutate the result; never hand out the cached object itself
+        return copy.deepcopy(cached[1])
+    
+    result = await process_conversational_request(user_input=user_input, context=context)
+    
+    if result.get("success") and result.get("intent") in _CACHEABLE_INTENTS:
+        # Drop expired entries so retries of many distinct prompts don't accumulate
+        for stale_key in [k for k, (ts, _) in _orchestration_cache.items() if now - ts >= ORCHESTRATION_CACHE_TTL]:
+            del _orchestration_cache[stale_key]
+        _orchestration_cache[key] = (now, copy.deepcopy(result))
+    
+    return result
 
-import asyncio
-import time
-from typing import Dict, Any
-from app.logger import logger
-from app.schema import Message
-from app.exceptions import AgentTaskComplete
-from app.tool.python_execute import PythonExecute
-from .types import OperationResult
-from .operations import ORCHESTRATION_AVAILABLE, process_conversational_request
+
+def _amounts_from_eth(amount: float) -> Tuple[float, float]:
+    """ETH and DOGE legs for a swap quoted in ETH"""
+    return amount, amount * 100
+
+
+def _amounts_from_doge(amount: float) -> Tuple[float, float]:
+    """ETH and DOGE legs for a swap quoted in DOGE"""
+    return amount * 0.001, amount
+
+
+# Swap legs by source currency; anything other than ETH is priced as DOGE
+_AMOUNTS = {"ETH": _amounts_from_eth, "DOGE": _amounts_from_doge}
+
+
+def _get_rpc_session():
+    """Shared keep-alive HTTP session for direct Sepolia JSON-RPC calls"""
+    global _rpc_session
+    if _rpc_session is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        _rpc_session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+        _rpc_session.mount("https://", adapter)
+        _rpc_session.mount("http://", adapter)
+    return _rpc_session
 
 
 class SwapExecutor:
     """Handles atomic swap execution with various strategies"""
     
+    __slots__ = ("agent",)
+    
     def __init__(self, agent_instance):
         self.agent = agent_instance
 
-    async def execute_atomic_swap(self, message: Message) -> bool:
-        """Execute REAL DogeSmartX atomic swap between ETH and DOGE."""
+    async def execute_atomic_swap(self, message: Message) -> Tuple[bool, str]:
+        """Execute REAL DogeSmartX atomic swap between ETH and DOGE.
+        
+        Returns (success, response); the caller appends/completes the task.
+        """
         logger.info("🚀 Executing REAL DogeSmartX atomic swap...")
         
         # Check if this is a complex swap request that could benefit from orchestration
-        content_lower = message.content.lower()
-        complex_swap_indicators = [
-            "when it's good", "optimal timing", "market conditions", "best time",
-            "analyze and swap", "intelligent swap", "automated swap", "monitor and execute"
-        ]
-        
-        if any(phrase in content_lower for phrase in complex_swap_indicators) and ORCHESTRATION_AVAILABLE:
+        if ORCHESTRATION_AVAILABLE and _COMPLEX_SWAP_RE.search(message.content, 0, COMPLEX_SWAP_SCAN_CHARS):
+            logger.info("🎭 Detecting complex swap request, considering orchestration...")
+            
+            # Bound orchestration so a stalled run falls back to the standard swap quickly
+            orch_task = asyncio.create_task(_cached_conversational_request(
+                user_input=message.content,
+                context={
+                    "agent": "dogesmartx_agent", 
+                    "operation": "atomic_swap",
+                    "enhancement": "intelligent_timing"
+                }
+            ))
+            
             try:
-                logger.info("🎭 Detecting complex swap request, considering orchestration...")
+                done, _ = await asyncio.wait([orch_task], timeout=ORCHESTRATION_TIMEOUT)
+                if not done:
+                    orch_task.cancel()
+                    raise asyncio.TimeoutError(f"orchestration exceeded {ORCHESTRATION_TIMEOUT}s")
                 
-                # Use orchestration for intelligent swap timing
-                orchestration_result = await process_conversational_request(
-                    user_input=message.content,
-                    context={
-                        "agent": "dogesmartx_agent", 
-                        "operation": "atomic_swap",
-                        "enhancement": "intelligent_timing"
-                    }
-                )
+                orchestration_result = orch_task.result()
                 
                 if orchestration_result.get("success"):
                     # If orchestration succeeded, format the result
@@ -92,154 +276,65 @@ class SwapExecutor:
 """
                     
                     logger.info("✅ Intelligent atomic swap orchestration completed!")
-                    # Don't append to messages - AgentTaskComplete will handle the response
-                    raise AgentTaskComplete(response)
+                    return True, response
                     
             except Exception as e:
-                logger.warning(f"Orchestration failed for intelligent swap, executing standard swap: {e}")
+                logger.warning("Orchestration failed for intelligent swap, executing standard swap: {}", e)
+            
+            return await self._execute_standard_atomic_swap(message)
         
         # Standard atomic swap execution
         return await self._execute_standard_atomic_swap(message)
 
-    async def _execute_standard_atomic_swap(self, message: Message) -> bool:
+    async def _get_wallet(self, initialize: bool = True):
+        """Return the agent's wallet, creating and initializing it once per agent.
+        
+        With initialize=False the wallet is only created, for callers that set up
+        just the side they need.
+        """
+        wallet = getattr(self.agent, 'dogesmartx_wallet', None)
+        if wallet is None:
+            from .wallet import DogeSmartXWallet
+            wallet = DogeSmartXWallet(testnet_mode=True)
+            self.agent.dogesmartx_wallet = wallet
+        if initialize and not wallet.initialized:
+            await wallet.initialize_wallets(use_funded_wallet=True)
+        return wallet
+
+    def _prepare_standard_fallback(self, message: Message) -> SwapRequest:
+        """Parse the swap request for the standard swap (synchronous regex parsing)"""
+        return self.agent.operation_router.parse_swap_request(message.content)
+
+    async def _execute_standard_atomic_swap(self, message: Message, swap_request: Optional[SwapRequest] = None) -> Tuple[bool, str]:
         """Execute standard atomic swap using wallet integration"""
         
         # Parse the user's requested amounts from the message
-        from .operations import OperationRouter
-        router = OperationRouter(self.agent)
-        swap_request = router.parse_swap_request(message.content)
+        if swap_request is None:
+            swap_request = self._prepare_standard_fallback(message)
         
         # Use the parsed amounts from user request
-        eth_amount = swap_request.from_amount if swap_request.from_currency == "ETH" else swap_request.from_amount * 0.001
-        doge_amount = swap_request.from_amount * 100 if swap_request.from_currency == "ETH" else swap_request.from_amount
-        
-        logger.info(f"🎯 Parsed swap request: {eth_amount} ETH ↔ {doge_amount} DOGE")
-        
-        # Use PythonExecute to execute real atomic swap with dynamic amounts
-        atomic_swap_script = f'''
-import asyncio
-import json
-from datetime import datetime
-from app.agent.dogesmartx.wallet import DogeSmartXWallet
-
-async def execute_real_swap():
-    """Execute real atomic swap with enhanced capabilities"""
-    print("🚀 DogeSmartX REAL Atomic Swap Execution")
-    print("=" * 70)
-    
-    try:
-        # Initialize DogeSmartX wallet
-        wallet = DogeSmartXWallet(testnet_mode=True)
-        
-        # Parse amounts from user message - using dynamic values
-        eth_amount = {eth_amount}  # ETH amount from user request
-        doge_amount = {doge_amount}  # DOGE amount calculated
-        
-        # Define recipient addresses for testing
-        recipient_eth = "0xb9966f1007e4ad3a37d29949162d68b0df8eb51c"  # Your funded wallet
-        recipient_doge = "nfLXEYM5EGRHhqrR9FzPKD7sBSQ3v5dj8s"  # Dogecoin testnet address
+        eth_amount, doge_amount = _AMOUNTS.get(swap_request.from_currency, _amounts_from_doge)(swap_request.from_amount)
         
-        print(f"💫 Initiating atomic swap:")
-        print(f"   💰 Amount: {{eth_amount}} ETH ↔ {{doge_amount}} DOGE")
-        print(f"   🎯 ETH recipient: {{recipient_eth}}")
-        print(f"   🎯 DOGE recipient: {{recipient_doge}}")
-        print(f"💫 Initiating atomic swap:")
-        print(f"   💰 Amount: {{eth_amount}} ETH ↔ {{doge_amount}} DOGE")
-        print(f"   🎯 ETH recipient: {{recipient_eth}}")
-        print(f"   🎯 DOGE recipient: {{recipient_doge}}")
+        logger.info("🎯 Parsed swap request: {} ETH ↔ {} DOGE", eth_amount, doge_amount)
         
-        # Execute the real atomic swap
-        result = await wallet.execute_real_atomic_swap(
-            eth_amount=eth_amount,
-            doge_amount=doge_amount,
-            recipient_eth_address=recipient_eth,
-            recipient_doge_address=recipient_doge,
-            funded_wallet_private_key=None  # Set to None for simulation with funded wallet check
-        )
-        
-        print(f"\\n✅ Atomic Swap Execution Results:")
-        print(f"   🆔 Swap ID: {{result['swap_id']}}")
-        print(f"   📊 Status: {{result['status']}}")
-        print(f"   🔄 Is Real Swap: {{result['is_real_swap']}}")
-        
-        # ETH side details
-        eth_side = result['eth_side']
-        print(f"\\n🔷 ETH Side (Sepolia):")
-        print(f"   📍 Contract: {{eth_side.get('contract_address', 'N/A')}}")
-        print(f"   💰 Amount: {{eth_side.get('amount_eth', 0)}} ETH")
-        print(f"   📊 Status: {{eth_side.get('status', 'unknown')}}")
-        if 'explorer_url' in eth_side:
-            print(f"   🔍 Explorer: {{eth_side['explorer_url']}}")
-        
-        # DOGE side details  
-        doge_side = result['doge_side']
-        print(f"\\n🐕 DOGE Side (Testnet):")
-        print(f"   📍 HTLC: {{doge_side.get('htlc_address', 'N/A')}}")
-        print(f"   💰 Amount: {{doge_side.get('amount_doge', 0)}} DOGE")
-        print(f"   📊 Status: {{doge_side.get('status', 'unknown')}}")
-        print(f"   🔧 Method: {{doge_side.get('deployment_method', 'unknown')}}")
-        
-        # Swap parameters
-        params = result['swap_parameters']
-        print(f"\\n🔑 Swap Parameters:")
-        print(f"   🗝️ Secret Hash: {{params['secret_hash'][:20]}}...")
-        print(f"   ⏰ Timelock: {{params['timelock']}}")
-        print(f"   📅 Expires: {{params['timelock_expires']}}")
-        
-        # Next actions
-        print(f"\\n🎯 Next Actions:")
-        for i, action in enumerate(result['next_actions'], 1):
-            print(f"   {{i}}. {{action}}")
-        
-        # Security info
-        print(f"\\n🛡️ Security Features:")
-        print(f"   🔐 Secret Available: {{result['secret_available']}}")
-        print(f"   ⏰ Timelock Protection: 24 hours")
-        print(f"   💸 Refund Mechanism: Available after timelock")
-        print(f"   🧪 Testnet Safety: All operations on testnets")
-        
-        # Check your funded wallet
-        if wallet.web3:
-            # Use the actual wallet address instead of hardcoded one
-            actual_wallet_address = getattr(wallet, 'funded_wallet_address', None) or wallet.sepolia_wallet.address
-            balance = wallet.web3.eth.get_balance(actual_wallet_address)
-            balance_eth = wallet.web3.from_wei(balance, 'ether')
-            
-            print(f"\\n💰 Your Funded Wallet:")
-            print(f"   📍 Address: {{actual_wallet_address}}")
-            print(f"   💰 Balance: {{balance_eth:.6f}} ETH")
-            
-            if balance_eth >= 0.002:
-                print(f"   ✅ Sufficient for real HTLC deployment!")
-                print(f"   💡 Provide private key for actual transactions")
-            else:
-                print(f"   ⚠️ Need more ETH for real deployment")
-        
-        print(f"\\n🎉 Real atomic swap execution completed!")
-        print(f"⭐ Status: {{result['status']}}")
-        
-        return result
-        
-    except Exception as e:
-        print(f"❌ Real atomic swap execution failed: {{e}}")
-        raise
-
-# Run the real swap execution
-result = asyncio.run(execute_real_swap())
-print(f"\\n📊 Final Result: {{result['status']}}")
-'''
-
         try:
-            python_tool = PythonExecute()
-            result = await python_tool.execute(atomic_swap_script)
-            
-            swap_output = ""
-            if hasattr(result, 'output'):
-                swap_output = result.output
-            elif hasattr(result, 'observation'):
-                swap_output = result.observation
-            else:
-                swap_output = str(result)
+            # Execute the real atomic swap in-process on the agent's wallet
+            wallet = await self._get_wallet()
+            
+            result = await wallet.execute_real_atomic_swap(
+                eth_amount=eth_amount,
+                doge_amount=doge_amount,
+                recipient_eth_address=ETH_RECIPIENT,
+                recipient_doge_address=DOGE_RECIPIENT,
+                funded_wallet_private_key=None  # Set to None for simulation with funded wallet check
+            )
+            
+            # The funded-wallet balance read and Dogechain storage are independent I/O
+            wallet_status, doge_storage_result = await asyncio.gather(
+                self._format_funded_wallet_status(wallet),
+                self._store_doge_in_dogechain_wallet(float(doge_amount)),
+            )
+            swap_output = self._format_swap_report(result, wallet_status)
             
             # Store operation result for response handler
             operation_result = {
@@ -265,8 +360,8 @@ print(f"\\n📊 Final Result: {{result['status']}}")
                     'timelock_expires': '2025-08-04T11:12:32'
                 },
                 'recipients': {
-                    'eth': '0xb9966f1007e4ad3a37d29949162d68b0df8eb51c',
-                    'doge': 'nfLXEYM5EGRHhqrR9FzPKD7sBSQ3v5dj8s'
+                    'eth': ETH_RECIPIENT,
+                    'doge': DOGE_RECIPIENT
                 },
                 'next_actions': [
                     'Monitor HTLC contracts on both chains',
@@ -282,14 +377,12 @@ print(f"\\n📊 Final Result: {{result['status']}}")
             self.agent.operation_result = operation_result
             
             # Get actual wallet information from dogechain_wallet.json
-            actual_wallet_address = "0xb9966f1007e4ad3a37d29949162d68b0df8eb51c"
+            actual_wallet_address = ETH_RECIPIENT
             actual_balance = "469.5 DOGE"
             total_doge = 469.5  # Default value
             
             # Try to load real wallet data from dogechain_wallet.json
             try:
-                import json
-                import os
                 dogechain_wallet_file = "dogechain_wallet.json"
                 if os.path.exists(dogechain_wallet_file):
                     with open(dogechain_wallet_file, 'r') as f:
@@ -298,105 +391,152 @@ print(f"\\n📊 Final Result: {{result['status']}}")
                     total_doge = wallet_data.get('total_doge_received', 469.5)
                     actual_balance = f"{total_doge} DOGE"
             except Exception as e:
-                # Fallback to trying agent wallet info
-                if hasattr(self.agent, 'dogesmartx_wallet') and self.agent.dogesmartx_wallet:
-                    wallet = self.agent.dogesmartx_wallet
-                    if hasattr(wallet, 'funded_wallet_address') and wallet.funded_wallet_address:
-                        actual_wallet_address = wallet.funded_wallet_address
-                    elif hasattr(wallet, 'sepolia_wallet') and wallet.sepolia_wallet:
-                        actual_wallet_address = wallet.sepolia_wallet.address
-                    
-                    # Get actual balance from blockchain
-                    if hasattr(wallet, 'web3') and wallet.web3 and actual_wallet_address != "Unknown":
-                        try:
-                            balance_wei = wallet.web3.eth.get_balance(actual_wallet_address)
-                            actual_balance = f"{wallet.web3.from_wei(balance_wei, 'ether'):.6f} ETH"
-                        except:
-                            actual_balance = f"{total_doge} DOGE"
-            
-            # Store DOGE in Dogechain wallet (Option A implementation)
-            doge_storage_result = await self._store_doge_in_dogechain_wallet(float(doge_amount))
-            
-            response = f"""🚀 **REAL Atomic Swap Execution Completed!**
-════════════════════════════════════════════════════════════════
-
-{swap_output}
-
-{doge_storage_result}
-
-🎯 **Real Atomic Swap Summary:**
-• ✅ Real swap logic executed successfully
-• 🔷 ETH HTLC deployment tested (Sepolia testnet)
-• 🐕 DOGE HTLC creation implemented with real scripts
-• 🔐 Cryptographic security verified
-• ⏰ Timelock protection activated
-• 💾 **DOGE permanently stored in Dogechain Testnet wallet**
+                # Fallback to the wallet the swap ran on
+                actual_wallet_address = wallet.active_address or actual_wallet_address
+                
+                # Get actual balance from blockchain
+                if wallet.web3:
+                    try:
+                        balance_wei = wallet.web3.eth.get_balance(actual_wallet_address)
+                        actual_balance = f"{wallet.web3.from_wei(balance_wei, 'ether'):.6f} ETH"
+                    except Exception as balance_error:
+                        logger.warning("⚠️ Could not read wallet balance for the report: {}", balance_error)
+                        actual_balance = f"{total_doge} DOGE"
+            
+            response = _SWAP_RESPONSE_TEMPLATE.format(
+                swap_output=swap_output,
+                doge_storage_result=doge_storage_result,
+                wallet_address=actual_wallet_address,
+                wallet_balance=actual_balance,
+            )
+            
+            logger.info("✅ Real DogeSmartX atomic swap executed successfully!")
+            return True, response
+            
+        except Exception as e:
+            logger.error("❌ Real atomic swap execution failed: {}", e)
+            return False, f"❌ Real DogeSmartX atomic swap failed: {str(e)}"
 
-🔧 **Technical Implementation:**
-• Real Web3 connection to Sepolia testnet
-• Actual HTLC smart contract deployment capability
-• Enhanced Dogecoin HTLC with realistic OP codes
-• Secret generation and hash verification
-• Gas estimation and balance checking
-• **Real DOGE storage on Dogechain Testnet**
+    def _format_swap_report(self, result: Dict[str, Any], wallet_status: str = "") -> str:
+        """Format the atomic swap execution result as the swap report"""
+        params = result['swap_parameters']
+        recipients = result['recipients']
+        eth_side = result['eth_side']
+        doge_side = result['doge_side']
 
-💰 **Your Funded Wallet Integration:**
-• Address: {actual_wallet_address}
-• Balance verification: {actual_balance}
-• Ready for real HTLC deployment with private key
+        lines = [
+            "🚀 DogeSmartX REAL Atomic Swap Execution",
+            "=" * 70,
+            "💫 Initiating atomic swap:",
+            f"   💰 Amount: {params['eth_amount']} ETH ↔ {params['doge_amount']} DOGE",
+            f"   🎯 ETH recipient: {recipients['eth']}",
+            f"   🎯 DOGE recipient: {recipients['doge']}",
+            "",
+            "✅ Atomic Swap Execution Results:",
+            f"   🆔 Swap ID: {result['swap_id']}",
+            f"   📊 Status: {result['status']}",
+            f"   🔄 Is Real Swap: {result['is_real_swap']}",
+            "",
+            "🔷 ETH Side (Sepolia):",
+            f"   📍 Contract: {eth_side.get('contract_address', 'N/A')}",
+            f"   💰 Amount: {eth_side.get('amount_eth', 0)} ETH",
+            f"   📊 Status: {eth_side.get('status', 'unknown')}",
+        ]
+        if 'explorer_url' in eth_side:
+            lines.append(f"   🔍 Explorer: {eth_side['explorer_url']}")
+
+        lines += [
+            "",
+            "🐕 DOGE Side (Testnet):",
+            f"   📍 HTLC: {doge_side.get('htlc_address', 'N/A')}",
+            f"   💰 Amount: {doge_side.get('amount_doge', 0)} DOGE",
+            f"   📊 Status: {doge_side.get('status', 'unknown')}",
+            f"   🔧 Method: {doge_side.get('deployment_method', 'unknown')}",
+            "",
+            "🔑 Swap Parameters:",
+            f"   🗝️ Secret Hash: {params['secret_hash'][:20]}...",
+            f"   ⏰ Timelock: {params['timelock']}",
+            f"   📅 Expires: {params['timelock_expires']}",
+            "",
+            "🎯 Next Actions:",
+        ]
+        lines += [f"   {i}. {action}" for i, action in enumerate(result['next_actions'], 1)]
+
+        lines += [
+            "",
+            "🛡️ Security Features:",
+            f"   🔐 Secret Available: {result['secret_available']}",
+            "   ⏰ Timelock Protection: 24 hours",
+            "   💸 Refund Mechanism: Available after timelock",
+            "   🧪 Testnet Safety: All operations on testnets",
+        ]
+        if wallet_status:
+            lines += ["", wallet_status]
+
+        lines += [
+            "",
+            "🎉 Real atomic swap execution completed!",
+            f"⭐ Status: {result['status']}",
+            "",
+            f"📊 Final Result: {result['status']}",
+        ]
+        return "\n".join(lines)
 
-🎯 **To Execute Real Swaps:**
-1. 🔑 Provide your private key securely
-2. 🚀 Deploy actual HTLC contracts on Sepolia
-3. 🔍 Monitor transactions on Etherscan
-4. ⚡ Complete cross-chain atomic swaps
+    async def _format_funded_wallet_status(self, wallet) -> str:
+        """Format the funded wallet balance section of the swap report"""
+        if not wallet.web3:
+            return ""
 
-✨ **DogeSmartX is ready for REAL atomic swaps with persistent DOGE storage!**
-"""
-            
-            logger.info("✅ Real DogeSmartX atomic swap executed successfully!")
-            # Don't append to messages - AgentTaskComplete will handle the response
-            raise AgentTaskComplete(response)
-            
-        except AgentTaskComplete:
-            raise
+        # Use the actual wallet address instead of hardcoded one
+        actual_wallet_address = wallet.active_address
+        try:
+            balance = await asyncio.to_thread(wallet.web3.eth.get_balance, actual_wallet_address)
         except Exception as e:
-            logger.error(f"❌ Real atomic swap execution failed: {e}")
-            error_response = f"❌ Real DogeSmartX atomic swap failed: {str(e)}"
-            # Don't append to messages - AgentTaskComplete will handle the response
-            raise AgentTaskComplete(error_response)
+            # This runs after the swap; a failed balance read only degrades this section
+            logger.warning("⚠️ Funded wallet balance unavailable: {}", e)
+            return "\n".join((
+                "💰 Your Funded Wallet:",
+                f"   📍 Address: {actual_wallet_address}",
+                "   ⚠️ Balance unavailable (RPC error)",
+            ))
+        balance_eth = wallet.web3.from_wei(balance, 'ether')
+
+        lines = [
+            "💰 Your Funded Wallet:",
+            f"   📍 Address: {actual_wallet_address}",
+            f"   💰 Balance: {balance_eth:.6f} ETH",
+        ]
+        if balance_eth >= 0.002:
+            lines += [
+                "   ✅ Sufficient for real HTLC deployment!",
+                "   💡 Provide private key for actual transactions",
+            ]
+        else:
+            lines.append("   ⚠️ Need more ETH for real deployment")
+        return "\n".join(lines)
 
     def _format_orchestration_result(self, execution_result: Dict[str, Any]) -> str:
         """Format orchestration execution result for display"""
         if not execution_result:
             return ""
             
-        formatted_lines = []
-        
-        if execution_result.get("agents_used"):
-            formatted_lines.append(f"🤖 **Agents Used**: {', '.join(execution_result['agents_used'])}")
-        
-        if execution_result.get("execution_time"):
-            formatted_lines.append(f"⏱️ **Execution Time**: {execution_result['execution_time']:.2f}s")
-        
-        if execution_result.get("user_experience"):
-            formatted_lines.append(f"🌟 **Experience**: {execution_result['user_experience']}")
-        
-        return "\n".join(formatted_lines) if formatted_lines else "Operation completed successfully"
+        parts = (
+            f"🤖 **Agents Used**: {', '.join(execution_result['agents_used'])}" if execution_result.get("agents_used") else None,
+            f"⏱️ **Execution Time**: {execution_result['execution_time']:.2f}s" if execution_result.get("execution_time") else None,
+            f"🌟 **Experience**: {execution_result['user_experience']}" if execution_result.get("user_experience") else None,
+        )
+        return "\n".join(filter(None, parts)) or "Operation completed successfully"
 
     async def _store_doge_in_dogechain_wallet(self, doge_amount: float) -> str:
         """Store DOGE in Dogechain Testnet wallet with REAL blockchain transactions"""
         try:
-            from .wallet import DogeSmartXWallet
             from .dogechain_faucet import DogechainFaucet
-            import os
-            import sys
             
             # Add enhanced simulator
             sys.path.append(os.path.join(os.path.dirname(__file__), '../../../'))
             from enhanced_doge_simulator import EnhancedDogeSimulator
             
-            target_address = "0xb9966f1007e4ad3a37d29949162d68b0df8eb51c"
+            target_address = ETH_RECIPIENT
             
             # Initialize real Dogechain faucet integration
             private_key = os.getenv('DOGESMARTX_PRIVATE_KEY')
@@ -469,14 +609,15 @@ print(f"\\n📊 Final Result: {{result['status']}}")
 • ⭐ Status: Enhanced simulation mode
 """
             
-            # Step 3: Also maintain local storage for tracking
-            wallet = DogeSmartXWallet(testnet_mode=True)
-            await wallet.initialize_wallets(use_funded_wallet=True)
-            self.agent.dogesmartx_wallet = wallet
+            # Step 3: Also maintain local storage for tracking; only the Dogechain
+            # side is needed, so skip the Sepolia/Dogecoin setup if not done yet
+            wallet = await self._get_wallet(initialize=False)
+            if not wallet.dogechain_wallet:
+                await wallet.initialize_dogechain_wallet()
             
             # Store locally for tracking
             local_storage_result = None
-            if hasattr(wallet, 'dogechain_wallet') and wallet.dogechain_wallet:
+            if wallet.dogechain_wallet:
                 local_storage_result = await wallet.dogechain_wallet.store_swap_doge(
                     doge_amount, 
                     target_address,
@@ -484,61 +625,57 @@ print(f"\\n📊 Final Result: {{result['status']}}")
                 )
             
             # Add 1inch Fusion bridge information
-            fusion_info = await self._get_1inch_fusion_bridge_info(doge_amount)
+            fusion_info = self._get_1inch_fusion_bridge_info(round(doge_amount, 6))
             
-            return f"""
-🐕 **REAL Dogechain Testnet Integration:**
-═══════════════════════════════════════════════════
-{real_blockchain_info}
-{transaction_info}
-
-📊 **Local Tracking:**
-═══════════════════════════════════════════════════
-• 📍 Address: {target_address}
-• 🌐 Network: Dogechain Testnet (ChainID: 568)
-• 🔍 Storage ID: {local_storage_result.get('storage_id', 'N/A') if local_storage_result else 'N/A'}
-• � **DUAL MODE**: Real blockchain + Local tracking
-• 🔗 RPC: https://rpc-testnet.dogechain.dog
-
-🌉 **1inch Fusion Bridge Available:**
-═══════════════════════════════════════════════════
-{fusion_info}
-
-🎯 **Your Dogecoin Mainnet Address:**
-• 📍 Target: D7MPeVvsVrQYBkVRRMrkHEJrpVHoRvEr4G
-• 🌉 Bridge via 1inch Fusion for cross-chain transfer
-• ⏰ Estimated time: 5-15 minutes
-• 💸 Bridge fee: ~0.1%
-"""
+            storage_id = local_storage_result.get('storage_id', 'N/A') if local_storage_result else 'N/A'
+            
+            return "\n".join((
+                "",
+                _DOGECHAIN_INTEGRATION_HEADER,
+                real_blockchain_info,
+                transaction_info,
+                "",
+                _LOCAL_TRACKING_HEADER,
+                f"• 📍 Address: {target_address}",
+                "• 🌐 Network: Dogechain Testnet (ChainID: 568)",
+                f"• 🔍 Storage ID: {storage_id}",
+                _LOCAL_TRACKING_FOOTER,
+                "",
+                _FUSION_BRIDGE_HEADER,
+                fusion_info,
+                "",
+                _MAINNET_BRIDGE_BLOCK,
+            ))
             
         except Exception as e:
-            logger.error(f"❌ REAL DOGE integration failed: {e}")
+            logger.error("❌ REAL DOGE integration failed: {}", e)
             return f"""
 🐕 **DOGE Integration Error:**
 ═══════════════════════════════════════════════════
 • ❌ Failed to setup real Dogechain integration: {str(e)}
-• 📍 Target Address: 0xb9966f1007e4ad3a37d29949162d68b0df8eb51c
+• 📍 Target Address: {ETH_RECIPIENT}
 • 🚨 Error: {str(e)}
 • 💡 Falling back to simulation mode
 
 🌉 **1inch Fusion Bridge Still Available:**
-• 🎯 Manual bridge to: D7MPeVvsVrQYBkVRRMrkHEJrpVHoRvEr4G
+• 🎯 Manual bridge to: {DOGE_MAINNET_TARGET}
 • 🔄 Use existing Dogechain DOGE for bridging
 """
 
-    async def _get_1inch_fusion_bridge_info(self, doge_amount: float) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _get_1inch_fusion_bridge_info(doge_amount: float) -> str:
         """Get 1inch Fusion bridge information for the current DOGE amount"""
         try:
             # Simulate 1inch Fusion quote
             bridge_fee_percent = 0.1
             output_amount = doge_amount * (1 - bridge_fee_percent / 100)
             
-            return f"""• ✅ 1inch Fusion bridge available for {doge_amount} DOGE
-• 💰 Output: ~{output_amount:.6f} DOGE (after {bridge_fee_percent}% fee)
-• 🔄 Route: Dogechain Testnet → Dogecoin Mainnet
-• ⚡ Cross-chain atomic swap technology
-• 🛡️ Secure and decentralized bridging
-• 📱 Execute bridge: Use 1inch Fusion interface"""
+            return "\n".join((
+                f"• ✅ 1inch Fusion bridge available for {doge_amount} DOGE",
+                f"• 💰 Output: ~{output_amount:.6f} DOGE (after {bridge_fee_percent}% fee)",
+                _FUSION_BRIDGE_FEATURES,
+            ))
             
         except Exception as e:
             return f"• ⚠️ 1inch Fusion info unavailable: {str(e)}"
@@ -547,165 +684,189 @@ print(f"\\n📊 Final Result: {{result['status']}}")
 class ContractDeploymentHandler:
     """Handles smart contract deployment operations"""
     
+    __slots__ = ("agent",)
+    
+    # Last Sepolia endpoint that answered, shared across handlers
+    _preferred_rpc: Optional[str] = None
+    
     def __init__(self, agent_instance):
         self.agent = agent_instance
 
-    async def execute_contract_deployment(self, message: Message) -> bool:
-        """Execute actual contract deployment on Sepolia testnet."""
+    async def execute_contract_deployment(self, message: Message) -> Tuple[bool, str]:
+        """Execute actual contract deployment on Sepolia testnet.
+        
+        Returns (success, response); the caller appends/completes the task.
+        """
         logger.info("🚀 Executing HTLC contract deployment on REAL Sepolia testnet...")
         
-        # Use PythonExecute to run REAL deployment scripts
-        deployment_script = '''
-import os
-import json
-import requests
-from datetime import datetime, timedelta
-from web3 import Web3
-import hashlib
-import secrets
-
-print("🚀 DogeSmartX REAL Sepolia Testnet Deployment")
-print("=" * 70)
-
-try:
-    # Enhanced deployment with real contract interaction
-    print("🔧 Connecting to Sepolia testnet...")
-    
-    # Multiple RPC endpoints for reliability
-    sepolia_rpcs = [
-        "https://ethereum-sepolia.rpc.subquery.network/public",
-        "https://rpc.sepolia.org", 
-        "https://sepolia.gateway.tenderly.co"
-    ]
-    
-    web3 = None
-    for rpc in sepolia_rpcs:
         try:
-            web3 = Web3(Web3.HTTPProvider(rpc))
-            if web3.is_connected():
-                print(f"✅ Connected to Sepolia via: {rpc}")
-                break
+            deployment_output = await self._analyze_sepolia_deployment()
+            
+            response = _DEPLOYMENT_RESPONSE_TEMPLATE.format(deployment_output=deployment_output)
+            
+            logger.info("✅ Real DogeSmartX contract deployment analysis completed!")
+            return True, response
+            
         except Exception as e:
-            print(f"⚠️ Failed {rpc}: {e}")
-            continue
-    
-    if not web3 or not web3.is_connected():
-        print("❌ Could not connect to Sepolia testnet")
-        print("🧪 Simulating deployment for demonstration...")
-        
-        # Simulate realistic deployment data
-        simulated_contract = f"0x{secrets.token_hex(20)}"
-        simulated_tx = f"0x{secrets.token_hex(32)}"
-        
-        print(f"\\n📋 Simulated HTLC Deployment Results:")
-        print(f"   📍 Contract Address: {simulated_contract}")
-        print(f"   🔗 Transaction Hash: {simulated_tx}")
-        print(f"   🔍 Explorer: https://sepolia.etherscan.io/tx/{simulated_tx}")
-        print(f"   ⛽ Estimated Gas: 750,000")
-        print(f"   💰 Estimated Cost: ~0.015 ETH")
-        
-    else:
-        # Real Sepolia interaction
-        chain_id = web3.eth.chain_id
-        print(f"🌐 Network Chain ID: {chain_id}")
-        
-        if chain_id != 11155111:
-            print(f"⚠️ Warning: Expected Sepolia (11155111), got {chain_id}")
-        
-        # Get latest block to verify connection
-        latest_block = web3.eth.get_block('latest')
-        print(f"📦 Latest Block: {latest_block.number}")
-        print(f"⏰ Block Time: {datetime.fromtimestamp(latest_block.timestamp)}")
+            logger.error("❌ Contract deployment failed: {}", e)
+            return False, f"❌ DogeSmartX contract deployment failed: {str(e)}"
+
+    async def _analyze_sepolia_deployment(self) -> str:
+        """Check Sepolia connectivity, funded wallet balance and gas cost for an HTLC deployment"""
+        lines = [
+            "🚀 DogeSmartX REAL Sepolia Testnet Deployment",
+            "=" * 70,
+            "🔧 Connecting to Sepolia testnet...",
+        ]
         
-        # Check your funded wallet balance  
-        # Try to get the actual wallet address instead of using hardcoded one
-        funded_wallet = "0xb9966f1007E4aD3A37D29949162d68b0dF8Eb51c"  # Current actual wallet
-        balance = web3.eth.get_balance(funded_wallet)
-        balance_eth = web3.from_wei(balance, 'ether')
+        # Reuse the endpoint that answered last time before racing all of them
+        state = None
+        rpc = ContractDeploymentHandler._preferred_rpc
+        if rpc:
+            try:
+                state = await self._fetch_deployment_state(rpc)
+            except Exception as e:
+                lines.append(f"⚠️ Failed {rpc}: {e}")
+                ContractDeploymentHandler._preferred_rpc = None
         
-        print(f"\\n💰 Your Funded Wallet Status:")
-        print(f"   📍 Address: {funded_wallet}")
-        print(f"   💰 Balance: {balance_eth:.6f} ETH")
+        if state is None:
+            rpc, state, failures = await self._race_deployment_state()
+            lines += failures
         
-        if balance_eth >= 0.02:  # Need ~0.02 ETH for contract deployment
-            print(f"   ✅ Sufficient balance for REAL contract deployment!")
-            print(f"   🔑 Provide private key to deploy actual HTLC contract")
+        if state is None:
+            lines += ["❌ Could not connect to Sepolia testnet", "🧪 Simulating deployment for demonstration..."]
+            
+            # Simulate realistic deployment data
+            simulated_contract = f"0x{secrets.token_hex(20)}"
+            simulated_tx = f"0x{secrets.token_hex(32)}"
+            
+            lines += [
+                "",
+                "📋 Simulated HTLC Deployment Results:",
+                f"   📍 Contract Address: {simulated_contract}",
+                f"   🔗 Transaction Hash: {simulated_tx}",
+                f"   🔍 Explorer: https://sepolia.etherscan.io/tx/{simulated_tx}",
+                "   ⛽ Estimated Gas: 750,000",
+                "   💰 Estimated Cost: ~0.015 ETH",
+            ]
         else:
-            print(f"   ⚠️ Need more ETH for real deployment")
-            print(f"   🚰 Get testnet ETH: https://sepoliafaucet.com/")
-        
-        # Estimate gas for HTLC deployment
-        gas_price = web3.eth.gas_price
-        gas_estimate = 800000  # Conservative estimate
-        deployment_cost = gas_price * gas_estimate
-        
-        print(f"\\n⛽ Gas Estimation:")
-        print(f"   🔥 Current Gas Price: {web3.from_wei(gas_price, 'gwei'):.2f} gwei")
-        print(f"   🏭 Estimated Gas Limit: {gas_estimate:,}")
-        print(f"   💰 Estimated Cost: {web3.from_wei(deployment_cost, 'ether'):.6f} ETH")
-        
-        print(f"\\n🔨 HTLC Contract Features:")
-        print(f"   🔐 Hash-locked funds with SHA256")
-        print(f"   ⏰ Time-locked with refund mechanism")
-        print(f"   🔄 Atomic swap compatible")
-        print(f"   🛡️ Secure secret reveal process")
-        
-    print(f"\\n✅ DogeSmartX contract deployment analysis complete!")
-    print(f"🎯 Ready for real HTLC deployment with private key")
-    
-except Exception as e:
-    print(f"❌ Deployment script error: {e}")
-    raise
-'''
-
-        try:
-            python_tool = PythonExecute()
-            result = await python_tool.execute(deployment_script)
-            
-            deployment_output = ""
-            if hasattr(result, 'output'):
-                deployment_output = result.output
-            elif hasattr(result, 'observation'):
-                deployment_output = result.observation
+            ContractDeploymentHandler._preferred_rpc = rpc
+            lines.append(f"✅ Connected to Sepolia via: {rpc}")
+            
+            chain_id = int(state["eth_chainId"], 16)
+            lines.append(f"🌐 Network Chain ID: {chain_id}")
+            if chain_id != SEPOLIA_CHAIN_ID:
+                lines.append(f"⚠️ Warning: Expected Sepolia ({SEPOLIA_CHAIN_ID}), got {chain_id}")
+            
+            latest_block = state["eth_getBlockByNumber"]
+            lines += [
+                f"📦 Latest Block: {int(latest_block['number'], 16)}",
+                f"⏰ Block Time: {datetime.fromtimestamp(int(latest_block['timestamp'], 16))}",
+            ]
+            
+            balance_eth = Decimal(int(state["eth_getBalance"], 16)) / WEI_PER_ETH
+            lines += [
+                "",
+                "💰 Your Funded Wallet Status:",
+                f"   📍 Address: {DEPLOYMENT_FUNDED_WALLET}",
+                f"   💰 Balance: {balance_eth:.6f} ETH",
+            ]
+            if balance_eth >= Decimal("0.02"):  # Need ~0.02 ETH for contract deployment
+                lines += [
+                    "   ✅ Sufficient balance for REAL contract deployment!",
+                    "   🔑 Provide private key to deploy actual HTLC contract",
+                ]
             else:
-                deployment_output = str(result)
-                
-            response = f"""🚀 **REAL Contract Deployment Analysis Completed!**
-════════════════════════════════════════════════════════════════
-
-{deployment_output}
-
-🎯 **Deployment Summary:**
-• ✅ Sepolia testnet connectivity verified
-• 🔧 Real Web3 integration tested
-• ⛽ Gas estimation performed
-• 💰 Wallet balance verification
-• 🔨 HTLC contract specifications confirmed
-
-🔧 **Technical Capabilities:**
-• Real contract deployment on Sepolia testnet
-• HTLC with hash and time locks
-• Atomic swap functionality
-• Secure refund mechanisms
-• Gas optimization strategies
-
-💡 **Next Steps for Real Deployment:**
-1. 🔑 Provide your funded wallet private key
-2. 🚀 Deploy actual HTLC smart contract
-3. 🔍 Monitor deployment on Etherscan
-4. ⚡ Execute real atomic swaps
-
-✨ **DogeSmartX is ready for REAL contract deployment!**
-"""
+                lines += [
+                    "   ⚠️ Need more ETH for real deployment",
+                    "   🚰 Get testnet ETH: https://sepoliafaucet.com/",
+                ]
             
-            logger.info("✅ Real DogeSmartX contract deployment analysis completed!")
-            # Don't append to messages - AgentTaskComplete will handle the response
-            raise AgentTaskComplete(response)
+            # Estimate gas for HTLC deployment
+            gas_price = int(state["eth_gasPrice"], 16)
+            gas_estimate = 800000  # Conservative estimate
+            deployment_cost = gas_price * gas_estimate
             
-        except AgentTaskComplete:
-            raise
-        except Exception as e:
-            logger.error(f"❌ Contract deployment failed: {e}")
-            error_response = f"❌ DogeSmartX contract deployment failed: {str(e)}"
-            # Don't append to messages - AgentTaskComplete will handle the response
-            raise AgentTaskComplete(error_response)
+            lines += [
+                "",
+                "⛽ Gas Estimation:",
+                f"   🔥 Current Gas Price: {Decimal(gas_price) / WEI_PER_GWEI:.2f} gwei",
+                f"   🏭 Estimated Gas Limit: {gas_estimate:,}",
+                f"   💰 Estimated Cost: {Decimal(deployment_cost) / WEI_PER_ETH:.6f} ETH",
+                "",
+                "🔨 HTLC Contract Features:",
+                "   🔐 Hash-locked funds with SHA256",
+                "   ⏰ Time-locked with refund mechanism",
+                "   🔄 Atomic swap compatible",
+                "   🛡️ Secure secret reveal process",
+            ]
+        
+        lines += [
+            "",
+            "✅ DogeSmartX contract deployment analysis complete!",
+            "🎯 Ready for real HTLC deployment with private key",
+        ]
+        return "\n".join(lines)
+
+    async def _race_deployment_state(self) -> Tuple[Optional[str], Optional[Dict[str, Any]], List[str]]:
+        """Query every Sepolia endpoint at once and keep the first successful answer"""
+        tasks = {asyncio.create_task(self._fetch_deployment_state(rpc)): rpc for rpc in DEFAULT_SEPOLIA_RPCS}
+        pending = set(tasks)
+        failures = []
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        return tasks[task], task.result(), failures
+                    failures.append(f"⚠️ Failed {tasks[task]}: {task.exception()}")
+        finally:
+            for task in pending:
+                task.cancel()
+        return None, None, failures
+
+    async def _fetch_deployment_state(self, rpc_url: str) -> Dict[str, Any]:
+        """Read chain id, latest block, funded balance and gas price in one JSON-RPC batch"""
+        session = _get_rpc_session()
+        now = time.monotonic()
+        
+        # Chain id never changes and gas price/latest block are stable for a block,
+        # so only the balance always needs a fresh read
+        state = {}
+        for method in _CACHED_RPC_METHODS:
+            cached = _rpc_state_cache.get((rpc_url, method))
+            if cached and (method in _CONSTANT_RPC_METHODS or now - cached[0] < RPC_STATE_TTL):
+                state[method] = cached[1]
+        
+        calls = tuple(call for call in (
+            ("eth_chainId", []),
+            ("eth_getBlockByNumber", ["latest", False]),
+            ("eth_getBalance", [DEPLOYMENT_FUNDED_WALLET, "latest"]),
+            ("eth_gasPrice", []),
+        ) if call[0] not in state)
+        payload = [
+            {"jsonrpc": "2.0", "id": i, "method": method, "params": params}
+            for i, (method, params) in enumerate(calls)
+        ]
+        
+        def post(body):
+            response = session.post(rpc_url, json=body, timeout=RPC_TIMEOUT)
+            response.raise_for_status()
+            return response.json()
+        
+        replies = await asyncio.to_thread(post, payload)
+        if not isinstance(replies, list):
+            # Provider rejected the batch; issue the calls concurrently instead
+            replies = await asyncio.gather(*(asyncio.to_thread(post, call) for call in payload))
+        
+        results = {}
+        for reply in replies:
+            if "error" in reply:
+                raise Exception(reply["error"].get("message", reply["error"]))
+            results[reply["id"]] = reply["result"]
+        
+        for i, (method, _) in enumerate(calls):
+            state[method] = results[i]
+            if method in _CACHED_RPC_METHODS:
+                _rpc_state_cache[(rpc_url, method)] = (now, results[i])
+        return state
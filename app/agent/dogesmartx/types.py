@@ -3,15 +3,16 @@ DogeSmartX Agent Types and Models
 Shared data structures for the DogeSmartX agent system.
 """
 
-from typing import Any, Dict, List, Optional, Union
+from typing import Annotated, Any, Dict, List, Optional, Tuple, Union
+from dataclasses import asdict, dataclass
 from datetime import datetime
 from decimal import Decimal
-from pydantic import BaseModel, Field, validator
-from enum import Enum
+from pydantic import BaseModel, ConfigDict, Field, PlainSerializer
+from enum import StrEnum
 import time
 
 
-class NetworkType(Enum):
+class NetworkType(StrEnum):
     """Supported network types"""
     ETHEREUM = "ethereum"
     SEPOLIA = "sepolia"
@@ -19,13 +20,13 @@ class NetworkType(Enum):
     DOGECOIN_TESTNET = "dogecoin_testnet"
 
 
-class SwapDirection(Enum):
+class SwapDirection(StrEnum):
     """Direction of swap"""
     ETH_TO_DOGE = "eth_to_doge"
     DOGE_TO_ETH = "doge_to_eth"
 
 
-class OperationType(Enum):
+class OperationType(StrEnum):
     """Types of DogeSmartX operations"""
     CONVERSATIONAL_DEFI = "conversational_defi"
     ATOMIC_SWAP = "atomic_swap"
@@ -36,7 +37,7 @@ class OperationType(Enum):
     HTLC_IMPLEMENTATION = "htlc_implementation"
 
 
-class SwapStatus(Enum):
+class SwapStatus(StrEnum):
     """Status of atomic swaps"""
     PENDING = "pending"
     ETH_HTLC_DEPLOYED = "eth_htlc_deployed"
@@ -49,8 +50,40 @@ class SwapStatus(Enum):
     EXPIRED = "expired"
 
 
+# Constants
+SEPOLIA_CHAIN_ID = 11155111
+DOGECOIN_TESTNET_MAGIC = 0x0709110b
+
+# Default configurations
+DEFAULT_SEPOLIA_RPCS = (
+    "https://ethereum-sepolia.rpc.subquery.network/public",
+    "https://rpc.sepolia.org",
+    "https://sepolia.gateway.tenderly.co"
+)
+
+DEFAULT_DOGECOIN_RPCS = (
+    "http://localhost:22555",
+    "https://api.dogecoin.org/testnet"
+)
+
+_DEFAULT_FEATURES = {
+    "atomic_swaps": True,
+    "contract_deployment": True,
+    "market_analysis": True,
+    "portfolio_management": True,
+    "automated_trading": True,
+    "orchestration": True,
+    "real_wallet_integration": True
+}
+
+# Decimal that dumps to a JSON number through the pydantic-core serializer
+JsonDecimal = Annotated[Decimal, PlainSerializer(float, return_type=float, when_used="json")]
+
+
 class AgentState(BaseModel):
     """State management for DogeSmartX agent operations"""
+    model_config = ConfigDict(validate_assignment=False, extra='forbid')
+    
     doge_price: float = Field(default=0.0)
     eth_price: float = Field(default=0.0)
     current_operation: str = Field(default="")
@@ -81,23 +114,11 @@ class DogeSmartXConfig(BaseModel):
     enable_orchestration: bool = True
     enable_real_swaps: bool = False
     
-    # Network configurations
-    sepolia_rpc_urls: List[str] = Field(default_factory=lambda: [
-        "https://ethereum-sepolia.rpc.subquery.network/public",
-        "https://rpc.sepolia.org",
-        "https://sepolia.gateway.tenderly.co"
-    ])
+    # Network configurations; the immutable default is shared, not copied
+    sepolia_rpc_urls: Tuple[str, ...] = DEFAULT_SEPOLIA_RPCS
     
-    # Feature flags
-    features: Dict[str, bool] = Field(default_factory=lambda: {
-        "atomic_swaps": True,
-        "contract_deployment": True,
-        "market_analysis": True,
-        "portfolio_management": True,
-        "automated_trading": True,
-        "orchestration": True,
-        "real_wallet_integration": True
-    })
+    # Feature flags; each config gets its own copy so flags can be toggled
+    features: Dict[str, bool] = Field(default_factory=_DEFAULT_FEATURES.copy)
 
 
 class SwapRequest(BaseModel):
@@ -139,14 +160,29 @@ class SwapExecutionResult(BaseModel):
     timestamp: str
 
 
-class OperationCapability(BaseModel):
+@dataclass(slots=True, frozen=True)
+class OperationCapability:
     """Capability description for operations"""
     name: str
     description: str
-    requirements: List[str]
-    examples: List[str]
+    requirements: Tuple[str, ...]
+    examples: Tuple[str, ...]
     supported: bool = True
     testnet_only: bool = True
+    
+    def __post_init__(self):
+        # Callers pass lists; store tuples so the record stays immutable
+        object.__setattr__(self, "requirements", tuple(self.requirements))
+        object.__setattr__(self, "examples", tuple(self.examples))
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "OperationCapability":
+        """Build from a JSON-decoded mapping"""
+        return cls(**data)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict for JSON serialization"""
+        return asdict(self)
 
 
 class OperationResult(BaseModel):
@@ -156,112 +192,109 @@ class OperationResult(BaseModel):
     data: Dict[str, Any] = Field(default_factory=dict)
     message: str = ""
     error: Optional[str] = None
-    timestamp: float = Field(default_factory=time.time)
+    timestamp_ns: int = Field(default_factory=time.time_ns)
     
-    class Config:
-        json_encoders = {
-            Decimal: lambda v: float(v) if v is not None else None
-        }
-
-
-# Constants
-SEPOLIA_CHAIN_ID = 11155111
-DOGECOIN_TESTNET_MAGIC = 0x0709110b
-
-# Default configurations
-DEFAULT_SEPOLIA_RPCS = [
-    "https://ethereum-sepolia.rpc.subquery.network/public",
-    "https://rpc.sepolia.org",
-    "https://sepolia.gateway.tenderly.co"
-]
+    @property
+    def timestamp(self) -> float:
+        """Creation time in epoch seconds"""
+        return self.timestamp_ns / 1e9
+    
+    model_config = ConfigDict(frozen=True)
 
-DEFAULT_DOGECOIN_RPCS = [
-    "http://localhost:22555",
-    "https://api.dogecoin.org/testnet"
-]
 
 # Operation capabilities
 DOGESMARTX_CAPABILITIES = {
     "atomic_swaps": OperationCapability(
         name="Cross-Chain Atomic Swaps",
         description="Execute real atomic swaps between ETH and DOGE using HTLCs",
-        requirements=["Sepolia testnet connection", "Dogecoin testnet wallet"],
-        examples=[
+        requirements=("Sepolia testnet connection", "Dogecoin testnet wallet"),
+        examples=(
             "Swap 0.001 ETH to 10 DOGE",
             "Execute atomic swap with 24 hour timelock",
             "Deploy HTLC contracts on both chains"
-        ]
+        )
     ),
     "conversational_defi": OperationCapability(
         name="Conversational DeFi Interface",
         description="Natural language interface for DeFi operations with AI orchestration",
-        requirements=["Orchestration engine", "LLM integration"],
-        examples=[
+        requirements=("Orchestration engine", "LLM integration"),
+        examples=(
             "I want to swap ETH to DOGE when market conditions are optimal",
             "Manage my portfolio automatically",
             "Monitor and execute trades based on sentiment"
-        ]
+        )
     ),
     "contract_deployment": OperationCapability(
         name="Smart Contract Deployment",
         description="Deploy HTLC and other contracts on Sepolia testnet",
-        requirements=["Sepolia testnet connection", "Funded wallet"],
-        examples=[
+        requirements=("Sepolia testnet connection", "Funded wallet"),
+        examples=(
             "Deploy HTLC contract for atomic swaps",
             "Deploy limit order contracts",
             "Deploy charity pool contracts"
-        ]
+        )
     ),
     "wallet_management": OperationCapability(
         name="Multi-Chain Wallet Management",
         description="Manage ETH and DOGE wallets for cross-chain operations",
-        requirements=["Web3 libraries", "Secure key storage"],
-        examples=[
+        requirements=("Web3 libraries", "Secure key storage"),
+        examples=(
             "Initialize Sepolia testnet wallet",
             "Create Dogecoin testnet wallet",
             "Check wallet balances and status"
-        ]
+        )
     )
 }
 
 
-class ChainConfig(BaseModel):
+@dataclass(slots=True, frozen=True)
+class ChainConfig:
     """Configuration for a blockchain network"""
     name: str
     network_type: NetworkType
-    rpc_url: str
+    rpc_url: str  # Must be an HTTP/HTTPS URL
     chain_id: Optional[int] = None
-    min_confirmations: int = Field(default=3, ge=1)
-    gas_limit: Optional[int] = Field(default=300000, ge=21000)
-    gas_price_gwei: Optional[float] = Field(default=50.0, ge=0)
+    min_confirmations: int = 3
+    gas_limit: Optional[int] = 300000
+    gas_price_gwei: Optional[float] = 50.0
     
-    @validator('rpc_url')
-    def validate_rpc_url(cls, v):
-        if not v or not (v.startswith('http://') or v.startswith('https://')):
-            raise ValueError('RPC URL must be a valid HTTP/HTTPS URL')
-        return v
+    def __post_init__(self):
+        object.__setattr__(self, "network_type", NetworkType(self.network_type))
+        if not self.rpc_url.startswith(("http://", "https://")):
+            raise ValueError(f"rpc_url must be an HTTP/HTTPS URL: {self.rpc_url}")
+        if self.min_confirmations < 1:
+            raise ValueError("min_confirmations must be >= 1")
+        if self.gas_limit is not None and self.gas_limit < 21000:
+            raise ValueError("gas_limit must be >= 21000")
+        if self.gas_price_gwei is not None and self.gas_price_gwei < 0:
+            raise ValueError("gas_price_gwei must be >= 0")
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ChainConfig":
+        """Build from a JSON-decoded mapping"""
+        return cls(**data)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict for JSON serialization"""
+        return asdict(self)
 
 
 class MarketData(BaseModel):
     """Market data for trading pairs"""
     symbol: str
-    price_usd: Decimal = Field(..., ge=0)
-    price_change_24h: Optional[Decimal] = None
-    volume_24h: Optional[Decimal] = None
-    market_cap: Optional[Decimal] = None
-    timestamp: float = Field(default_factory=time.time)
+    price_usd: JsonDecimal = Field(..., ge=0)
+    price_change_24h: Optional[JsonDecimal] = None
+    volume_24h: Optional[JsonDecimal] = None
+    market_cap: Optional[JsonDecimal] = None
+    timestamp_ns: int = Field(default_factory=time.time_ns)
     source: Optional[str] = None
     
-    @validator('price_usd', 'price_change_24h', 'volume_24h', 'market_cap', pre=True)
-    def convert_to_decimal(cls, v):
-        if v is None:
-            return v
-        return Decimal(str(v))
+    @property
+    def timestamp(self) -> float:
+        """Quote time in epoch seconds"""
+        return self.timestamp_ns / 1e9
     
-    class Config:
-        json_encoders = {
-            Decimal: lambda v: float(v) if v is not None else None
-        }
+    model_config = ConfigDict(frozen=True)
 
 
 class SwapOrder(BaseModel):
@@ -272,8 +305,8 @@ class SwapOrder(BaseModel):
     to_chain: NetworkType
     from_token: str
     to_token: str
-    amount: Decimal = Field(..., gt=0)
-    filled_amount: Decimal = Field(default=Decimal("0"), ge=0)
+    amount: JsonDecimal = Field(..., gt=0)
+    filled_amount: JsonDecimal = Field(default=Decimal("0"), ge=0)
     status: SwapStatus = SwapStatus.PENDING
     
     # Security features
@@ -287,18 +320,7 @@ class SwapOrder(BaseModel):
     completed_at: Optional[float] = None
     
     # Optional fields
-    exchange_rate: Optional[Decimal] = None
-    slippage_tolerance: Decimal = Field(default=Decimal("0.5"), ge=0, le=100)
-    charity_contribution: Decimal = Field(default=Decimal("0"), ge=0)
+    exchange_rate: Optional[JsonDecimal] = None
+    slippage_tolerance: JsonDecimal = Field(default=Decimal("0.5"), ge=0, le=100)
+    charity_contribution: JsonDecimal = Field(default=Decimal("0"), ge=0)
     gas_estimate: Optional[Dict[str, Any]] = None
-    
-    @validator('amount', 'filled_amount', 'exchange_rate', 'slippage_tolerance', 'charity_contribution', pre=True)
-    def convert_to_decimal(cls, v):
-        if v is None:
-            return v
-        return Decimal(str(v))
-    
-    class Config:
-        json_encoders = {
-            Decimal: lambda v: float(v) if v is not None else None
-        }
@@ -5,116 +5,19 @@ Utility functions and handlers for wallet setup, testing, and other operations.
 """
 
 import asyncio
-from typing import Dict, Any
+import functools
+from typing import Dict, Any, Tuple
 from app.logger import logger
 from app.schema import Message
 from app.exceptions import AgentTaskComplete
-from app.tool.python_execute import PythonExecute
+from .wallet import DogeSmartXWallet
 
+# Assistant replies are built at the tail of every handler from text we produced
+# ourselves, so skip validation; external callers still go through Message(...)
+_assistant_message = functools.partial(Message.model_construct, role="assistant")
 
-class WalletSetupHandler:
-    """Handles wallet initialization and setup operations"""
-    
-    def __init__(self, agent_instance):
-        self.agent = agent_instance
-
-    async def execute_wallet_setup(self, message: Message) -> bool:
-        """Execute DogeSmartX wallet setup and initialization."""
-        logger.info("🔧 Executing DogeSmartX wallet setup...")
-        
-        wallet_setup_script = '''
-import asyncio
-from app.agent.dogesmartx.wallet import DogeSmartXWallet
-
-async def setup_wallet():
-    """Setup DogeSmartX wallets for both ETH and DOGE"""
-    print("🔧 DogeSmartX Wallet Setup & Initialization")
-    print("=" * 70)
-    
-    try:
-        # Initialize DogeSmartX wallet system
-        wallet = DogeSmartXWallet(testnet_mode=True)
-        
-        print("🚀 Initializing dual-chain wallet system...")
-        
-        # Initialize both Sepolia and Dogecoin wallets
-        result = await wallet.initialize_wallets(use_funded_wallet=True)
-        
-        print("\\n✅ Wallet Initialization Results:")
-        
-        # Sepolia wallet details
-        sepolia_info = result['sepolia']
-        print(f"\\n🔷 Sepolia Testnet Wallet:")
-        print(f"   📍 Address: {sepolia_info['address'][:10]}...{sepolia_info['address'][-10:]}")
-        print(f"   💰 Balance: {sepolia_info['balance_eth']:.6f} ETH")
-        print(f"   🌐 Network: {sepolia_info['network']}")
-        print(f"   🔗 Chain ID: {sepolia_info['chain_id']}")
-        
-        if 'funded_wallet' in sepolia_info:
-            funded = sepolia_info['funded_wallet']
-            print(f"   💎 Funded Wallet: {funded['address']}")
-            print(f"   💰 Funded Balance: {funded['balance_eth']:.6f} ETH")
-        
-        # Dogecoin wallet details
-        doge_info = result['dogecoin']
-        print(f"\\n🐕 Dogecoin Testnet Wallet:")
-        print(f"   📍 Address: {doge_info['address'][:10]}...{doge_info['address'][-10:]}")
-        print(f"   💰 Balance: {doge_info['balance_doge']:.8f} DOGE")
-        print(f"   🌐 Network: {doge_info['network']}")
-        
-        if doge_info.get('simulated'):
-            print(f"   🧪 Mode: Enhanced Simulation")
-            print(f"   💡 Real Dogecoin integration available with bitcoinlib")
-        
-        # Wallet capabilities
-        print(f"\\n🛠️ Wallet Capabilities:")
-        print(f"   ✅ Cross-chain atomic swaps")
-        print(f"   ✅ HTLC contract deployment")
-        print(f"   ✅ Real Sepolia testnet integration")
-        print(f"   ✅ Enhanced Dogecoin simulation")
-        print(f"   ✅ Secure secret management")
-        print(f"   ✅ Timelock protection")
-        
-        # Security features
-        print(f"\\n🛡️ Security Features:")
-        print(f"   🔐 Cryptographic secret generation")
-        print(f"   🔒 Hash-locked transactions")
-        print(f"   ⏰ Time-locked refunds")
-        print(f"   🧪 Testnet-only operations")
-        print(f"   💸 Funded wallet integration")
-        
-        # Next steps
-        print(f"\\n🎯 Ready for Operations:")
-        print(f"   1. 🔄 Execute atomic swaps")
-        print(f"   2. 🔨 Deploy HTLC contracts")
-        print(f"   3. 📊 Monitor swap status")
-        print(f"   4. 💰 Claim/refund operations")
-        
-        print(f"\\n✅ DogeSmartX wallet system ready!")
-        return result
-        
-    except Exception as e:
-        print(f"❌ Wallet setup failed: {e}")
-        raise
-
-# Run wallet setup
-result = asyncio.run(setup_wallet())
-print(f"\\n📊 Setup Complete: {len(result)} wallets initialized")
-'''
-
-        try:
-            python_tool = PythonExecute()
-            result = await python_tool.execute(wallet_setup_script)
-            
-            setup_output = ""
-            if hasattr(result, 'output'):
-                setup_output = result.output
-            elif hasattr(result, 'observation'):
-                setup_output = result.observation
-            else:
-                setup_output = str(result)
-            
-            response = f"""🔧 **DogeSmartX Wallet Setup Completed!**
+# Response bodies; only the output slot varies per call
+_WALLET_SETUP_RESPONSE_TEMPLATE = """🔧 **DogeSmartX Wallet Setup Completed!**
 ════════════════════════════════════════════════════════════════
 
 {setup_output}
@@ -141,9 +44,53 @@ print(f"\\n📊 Setup Complete: {len(result)} wallets initialized")
 
 ✨ **DogeSmartX wallet system is fully operational!**
 """
+
+_TEST_SUITE_RESPONSE_TEMPLATE = """🧪 **DogeSmartX Test Suite Completed!**
+════════════════════════════════════════════════════════════════
+
+{test_output}
+
+🎯 **Test Execution Summary:**
+• ✅ Comprehensive testing completed
+• 🔧 Wallet system validation
+• 🔄 Atomic swap parameter testing
+• 🔷 ETH HTLC deployment simulation
+• 🐕 DOGE HTLC creation testing
+• 📊 Status management verification
+• 🛡️ Security feature validation
+
+🔬 **Technical Validation:**
+• Cross-chain swap logic verified
+• HTLC contract structure tested
+• Secret management security confirmed
+• Timelock mechanisms validated
+• Error handling robustness checked
+
+💡 **DogeSmartX System Status:**
+All core functionalities have been tested and validated.
+The system is ready for real atomic swap operations.
+
+✨ **Quality assurance complete - DogeSmartX is operational!**
+"""
+
+
+class WalletSetupHandler:
+    """Handles wallet initialization and setup operations"""
+    
+    def __init__(self, agent_instance):
+        self.agent = agent_instance
+
+    async def execute_wallet_setup(self, message: Message) -> bool:
+        """Execute DogeSmartX wallet setup and initialization."""
+        logger.info("🔧 Executing DogeSmartX wallet setup...")
+        
+        try:
+            setup_output = await self._run_wallet_setup()
+            
+            response = _WALLET_SETUP_RESPONSE_TEMPLATE.format(setup_output=setup_output)
             
             logger.info("✅ DogeSmartX wallet setup completed successfully!")
-            self.agent.messages.append(Message(role="assistant", content=response))
+            self.agent.messages.append(_assistant_message(content=response))
             raise AgentTaskComplete(response)
             
         except AgentTaskComplete:
@@ -151,9 +98,85 @@ print(f"\\n📊 Setup Complete: {len(result)} wallets initialized")
         except Exception as e:
             logger.error(f"❌ Wallet setup failed: {e}")
             error_response = f"❌ DogeSmartX wallet setup failed: {str(e)}"
-            self.agent.messages.append(Message(role="assistant", content=error_response))
+            self.agent.messages.append(_assistant_message(content=error_response))
             raise AgentTaskComplete(error_response)
 
+    async def _run_wallet_setup(self) -> str:
+        """Initialize both Sepolia and Dogecoin wallets and report their state"""
+        lines = [
+            "🔧 DogeSmartX Wallet Setup & Initialization",
+            "=" * 70,
+            "🚀 Initializing dual-chain wallet system...",
+        ]
+        
+        # Initialize both Sepolia and Dogecoin wallets; keep them for later operations
+        wallet = DogeSmartXWallet(testnet_mode=True)
+        result = await wallet.initialize_wallets(use_funded_wallet=True)
+        self.agent.dogesmartx_wallet = wallet
+        
+        lines += ["", "✅ Wallet Initialization Results:"]
+        
+        # Sepolia wallet details
+        sepolia_info = result['sepolia']
+        lines += [
+            "",
+            "🔷 Sepolia Testnet Wallet:",
+            f"   📍 Address: {sepolia_info['address'][:10]}...{sepolia_info['address'][-10:]}",
+            f"   💰 Balance: {sepolia_info['balance_eth']:.6f} ETH",
+            f"   🌐 Network: {sepolia_info['network']}",
+            f"   🔗 Chain ID: {sepolia_info['chain_id']}",
+        ]
+        if 'funded_wallet' in sepolia_info:
+            funded = sepolia_info['funded_wallet']
+            lines += [
+                f"   💎 Funded Wallet: {funded['address']}",
+                f"   💰 Funded Balance: {funded['balance_eth']:.6f} ETH",
+            ]
+        
+        # Dogecoin wallet details
+        doge_info = result['dogecoin']
+        lines += [
+            "",
+            "🐕 Dogecoin Testnet Wallet:",
+            f"   📍 Address: {doge_info['address'][:10]}...{doge_info['address'][-10:]}",
+            f"   💰 Balance: {doge_info['balance_doge']:.8f} DOGE",
+            f"   🌐 Network: {doge_info['network']}",
+        ]
+        if doge_info.get('simulated'):
+            lines += [
+                "   🧪 Mode: Enhanced Simulation",
+                "   💡 Real Dogecoin integration available with bitcoinlib",
+            ]
+        
+        lines += [
+            "",
+            "🛠️ Wallet Capabilities:",
+            "   ✅ Cross-chain atomic swaps",
+            "   ✅ HTLC contract deployment",
+            "   ✅ Real Sepolia testnet integration",
+            "   ✅ Enhanced Dogecoin simulation",
+            "   ✅ Secure secret management",
+            "   ✅ Timelock protection",
+            "",
+            "🛡️ Security Features:",
+            "   🔐 Cryptographic secret generation",
+            "   🔒 Hash-locked transactions",
+            "   ⏰ Time-locked refunds",
+            "   🧪 Testnet-only operations",
+            "   💸 Funded wallet integration",
+            "",
+            "🎯 Ready for Operations:",
+            "   1. 🔄 Execute atomic swaps",
+            "   2. 🔨 Deploy HTLC contracts",
+            "   3. 📊 Monitor swap status",
+            "   4. 💰 Claim/refund operations",
+            "",
+            "✅ DogeSmartX wallet system ready!",
+            "",
+            f"📊 Setup Complete: {len(result)} wallets initialized",
+        ]
+        return "\n".join(lines)
+
 
 class TestExecutionHandler:
     """Handles test execution and validation operations"""
@@ -165,253 +188,218 @@ class TestExecutionHandler:
         """Execute comprehensive DogeSmartX testing."""
         logger.info("🧪 Executing DogeSmartX test suite...")
         
-        test_script = '''
-import asyncio
-from app.agent.dogesmartx.wallet import DogeSmartXWallet
+        try:
+            test_output = await self._run_tests()
+            
+            response = _TEST_SUITE_RESPONSE_TEMPLATE.format(test_output=test_output)
+            
+            logger.info("✅ DogeSmartX test suite completed successfully!")
+            self.agent.messages.append(_assistant_message(content=response))
+            raise AgentTaskComplete(response)
+            
+        except AgentTaskComplete:
+            raise
+        except Exception as e:
+            logger.error(f"❌ Test execution failed: {e}")
+            error_response = f"❌ DogeSmartX test execution failed: {str(e)}"
+            self.agent.messages.append(_assistant_message(content=error_response))
+            raise AgentTaskComplete(error_response)
 
-async def run_tests():
-    """Run comprehensive DogeSmartX tests"""
-    print("🧪 DogeSmartX Comprehensive Test Suite")
-    print("=" * 70)
-    
-    try:
+    async def _run_tests(self) -> str:
+        """Run the DogeSmartX test suite against a fresh wallet and report the results"""
+        lines = ["🧪 DogeSmartX Comprehensive Test Suite", "=" * 70]
         test_results = {}
         
         # Test 1: Wallet Initialization
-        print("\\n🔧 Test 1: Wallet Initialization")
+        lines += ["", "🔧 Test 1: Wallet Initialization"]
         wallet = DogeSmartXWallet(testnet_mode=True)
         init_result = await wallet.initialize_wallets(use_funded_wallet=True)
         test_results['wallet_init'] = 'PASS' if init_result else 'FAIL'
-        print(f"   Result: {test_results['wallet_init']}")
+        lines.append(f"   Result: {test_results['wallet_init']}")
         
         # Test 2: Swap Parameters Creation
-        print("\\n🔄 Test 2: Atomic Swap Parameters")
+        lines += ["", "🔄 Test 2: Atomic Swap Parameters"]
         swap_params = await wallet.create_atomic_swap(0.001, 10.0, timelock_hours=1)
         test_results['swap_params'] = 'PASS' if swap_params else 'FAIL'
-        print(f"   Swap ID: {swap_params.swap_id}")
-        print(f"   Secret Hash: {swap_params.secret_hash[:20]}...")
-        print(f"   Result: {test_results['swap_params']}")
+        lines += [
+            f"   Swap ID: {swap_params.swap_id}",
+            f"   Secret Hash: {swap_params.secret_hash[:20]}...",
+            f"   Result: {test_results['swap_params']}",
+        ]
         
         # Test 3: ETH HTLC Simulation
-        print("\\n🔷 Test 3: ETH HTLC Deployment (Simulated)")
+        lines += ["", "🔷 Test 3: ETH HTLC Deployment (Simulated)"]
         try:
             eth_htlc = await wallet._simulate_eth_htlc_deployment(
                 swap_params, 
                 "0x742d35Cc6634C05322925a3b8D200dFa8D2C88531"
             )
             test_results['eth_htlc'] = 'PASS'
-            print(f"   Contract: {eth_htlc['contract_address']}")
-            print(f"   Explorer: {eth_htlc['explorer_url']}")
+            lines += [
+                f"   Contract: {eth_htlc['contract_address']}",
+                f"   Explorer: {eth_htlc['explorer_url']}",
+            ]
         except Exception as e:
             test_results['eth_htlc'] = 'FAIL'
-            print(f"   Error: {e}")
-        print(f"   Result: {test_results['eth_htlc']}")
+            lines.append(f"   Error: {e}")
+        lines.append(f"   Result: {test_results['eth_htlc']}")
         
         # Test 4: DOGE HTLC Simulation
-        print("\\n🐕 Test 4: DOGE HTLC Deployment (Simulated)")
+        lines += ["", "🐕 Test 4: DOGE HTLC Deployment (Simulated)"]
         try:
             doge_htlc = await wallet._deploy_simulated_doge_htlc(
                 swap_params,
                 "nfLXEYM5EGRHhqrR9FzPKD7sBSQ3v5dj8s"
             )
             test_results['doge_htlc'] = 'PASS'
-            print(f"   HTLC Address: {doge_htlc['htlc_address']}")
-            print(f"   Script Length: {len(doge_htlc['htlc_script'])} bytes")
+            lines += [
+                f"   HTLC Address: {doge_htlc['htlc_address']}",
+                f"   Script Length: {len(doge_htlc['htlc_script'])} bytes",
+            ]
         except Exception as e:
             test_results['doge_htlc'] = 'FAIL'
-            print(f"   Error: {e}")
-        print(f"   Result: {test_results['doge_htlc']}")
+            lines.append(f"   Error: {e}")
+        lines.append(f"   Result: {test_results['doge_htlc']}")
         
         # Test 5: Swap Status Management
-        print("\\n📊 Test 5: Swap Status Management")
+        lines += ["", "📊 Test 5: Swap Status Management"]
         try:
             status = wallet.get_swap_status(swap_params.swap_id)
             test_results['swap_status'] = 'PASS'
-            print(f"   Status: {status['status']}")
-            print(f"   Time Remaining: {status['time_remaining_hours']:.2f} hours")
+            lines += [
+                f"   Status: {status['status']}",
+                f"   Time Remaining: {status['time_remaining_hours']:.2f} hours",
+            ]
         except Exception as e:
             test_results['swap_status'] = 'FAIL'
-            print(f"   Error: {e}")
-        print(f"   Result: {test_results['swap_status']}")
+            lines.append(f"   Error: {e}")
+        lines.append(f"   Result: {test_results['swap_status']}")
         
         # Test 6: Security Features
-        print("\\n🛡️ Test 6: Security Features")
+        lines += ["", "🛡️ Test 6: Security Features"]
         try:
             secret = wallet.get_swap_secret(swap_params.swap_id)
             secret_available = len(secret) == 64  # 32 bytes = 64 hex chars
             test_results['security'] = 'PASS' if secret_available else 'FAIL'
-            print(f"   Secret Length: {len(secret)} chars")
-            print(f"   Secret Available: {secret_available}")
+            lines += [
+                f"   Secret Length: {len(secret)} chars",
+                f"   Secret Available: {secret_available}",
+            ]
         except Exception as e:
             test_results['security'] = 'FAIL'
-            print(f"   Error: {e}")
-        print(f"   Result: {test_results['security']}")
+            lines.append(f"   Error: {e}")
+        lines.append(f"   Result: {test_results['security']}")
         
         # Test Summary
-        print(f"\\n📋 Test Summary:")
-        print(f"=" * 40)
+        lines += ["", "📋 Test Summary:", "=" * 40]
         passed_tests = sum(1 for result in test_results.values() if result == 'PASS')
         total_tests = len(test_results)
         
         for test_name, result in test_results.items():
             status_icon = "✅" if result == "PASS" else "❌"
-            print(f"   {status_icon} {test_name.replace('_', ' ').title()}: {result}")
-        
-        print(f"\\n🎯 Overall Result: {passed_tests}/{total_tests} tests passed")
+            lines.append(f"   {status_icon} {test_name.replace('_', ' ').title()}: {result}")
         
+        lines += ["", f"🎯 Overall Result: {passed_tests}/{total_tests} tests passed", ""]
         if passed_tests == total_tests:
-            print("\\n🎉 All tests passed! DogeSmartX is fully operational!")
+            lines.append("🎉 All tests passed! DogeSmartX is fully operational!")
         else:
-            print(f"\\n⚠️ {total_tests - passed_tests} test(s) failed. Review errors above.")
+            lines.append(f"⚠️ {total_tests - passed_tests} test(s) failed. Review errors above.")
         
-        return test_results
-        
-    except Exception as e:
-        print(f"❌ Test suite execution failed: {e}")
-        raise
-
-# Run test suite
-result = asyncio.run(run_tests())
-'''
+        return "\n".join(lines)
 
-        try:
-            python_tool = PythonExecute()
-            result = await python_tool.execute(test_script)
-            
-            test_output = ""
-            if hasattr(result, 'output'):
-                test_output = result.output
-            elif hasattr(result, 'observation'):
-                test_output = result.observation
-            else:
-                test_output = str(result)
-            
-            response = f"""🧪 **DogeSmartX Test Suite Completed!**
-════════════════════════════════════════════════════════════════
 
-{test_output}
+# Per-operation expertise and guidance shown to the user, with fallbacks for
+# unknown operation types
+_EXPERTISE_MAP = {
+    "atomic_swap": (
+        "Cross-chain atomic swaps between ETH and DOGE",
+        "HTLC (Hash Time-Locked Contract) implementation",
+        "Sepolia testnet integration with real Web3 connectivity",
+        "Enhanced Dogecoin HTLC with realistic OP codes",
+        "Cryptographic secret generation and management",
+        "Timelock-based refund mechanisms",
+        "Real transaction deployment capabilities"
+    ),
+    "contract_deployment": (
+        "Real HTLC smart contract deployment on Sepolia testnet",
+        "Solidity contract compilation and bytecode generation",
+        "Gas estimation and optimization strategies",
+        "Web3 transaction signing and broadcasting",
+        "Contract interaction and state management",
+        "Etherscan integration for transaction monitoring",
+        "Multi-RPC endpoint failover for reliability"
+    ),
+    "wallet_setup": (
+        "Dual-chain wallet initialization (ETH + DOGE)",
+        "Sepolia testnet wallet creation with real keys",
+        "Dogecoin testnet integration with bitcoinlib",
+        "Funded wallet balance verification and management",
+        "Cross-chain address generation and validation",
+        "Secure key storage and management practices",
+        "Network connectivity testing and optimization"
+    ),
+    "test_execution": (
+        "Comprehensive test suite for all DogeSmartX features",
+        "Atomic swap parameter validation testing",
+        "HTLC deployment simulation and verification",
+        "Security feature testing and validation",
+        "Error handling and edge case testing",
+        "Performance testing and optimization",
+        "Integration testing with real testnet networks"
+    )
+}
 
-🎯 **Test Execution Summary:**
-• ✅ Comprehensive testing completed
-• 🔧 Wallet system validation
-• 🔄 Atomic swap parameter testing
-• 🔷 ETH HTLC deployment simulation
-• 🐕 DOGE HTLC creation testing
-• 📊 Status management verification
-• 🛡️ Security feature validation
+_DEFAULT_EXPERTISE = (
+    "DogeSmartX cross-chain DeFi operations",
+    "Real atomic swap implementation",
+    "Testnet integration and testing",
+    "Secure cryptographic operations"
+)
 
-🔬 **Technical Validation:**
-• Cross-chain swap logic verified
-• HTLC contract structure tested
-• Secret management security confirmed
-• Timelock mechanisms validated
-• Error handling robustness checked
+_GUIDANCE_MAP = {
+    "atomic_swap": (
+        "1. Specify your DeFi operation (swap ETH ↔ DOGE)",
+        "2. Configure swap amounts and recipient addresses", 
+        "3. Execute atomic swap with HTLC deployment",
+        "4. Monitor swap progress and claim funds"
+    ),
+    "contract_deployment": (
+        "1. Configure Sepolia testnet connection",
+        "2. Prepare HTLC contract parameters",
+        "3. Deploy contract with gas optimization",
+        "4. Verify deployment on Etherscan"
+    ),
+    "wallet_setup": (
+        "1. Initialize dual-chain wallet system",
+        "2. Connect to Sepolia and Dogecoin testnets",
+        "3. Verify wallet balances and connectivity",
+        "4. Test cross-chain operations"
+    ),
+    "test_execution": (
+        "1. Run comprehensive test suite",
+        "2. Validate all core functionalities",
+        "3. Check security and error handling",
+        "4. Confirm system readiness"
+    )
+}
 
-💡 **DogeSmartX System Status:**
-All core functionalities have been tested and validated.
-The system is ready for real atomic swap operations.
-
-✨ **Quality assurance complete - DogeSmartX is operational!**
-"""
-            
-            logger.info("✅ DogeSmartX test suite completed successfully!")
-            self.agent.messages.append(Message(role="assistant", content=response))
-            raise AgentTaskComplete(response)
-            
-        except AgentTaskComplete:
-            raise
-        except Exception as e:
-            logger.error(f"❌ Test execution failed: {e}")
-            error_response = f"❌ DogeSmartX test execution failed: {str(e)}"
-            self.agent.messages.append(Message(role="assistant", content=error_response))
-            raise AgentTaskComplete(error_response)
+_DEFAULT_GUIDANCE = (
+    "1. Specify your DeFi operation (swap, deploy, test)",
+    "2. Configure testnet settings", 
+    "3. Execute operation with monitoring",
+    "4. Validate results and security"
+)
 
 
 class UtilityFunctions:
     """Collection of utility functions for DogeSmartX operations"""
     
     @staticmethod
-    def get_dogesmartx_expertise(operation_type: str) -> list:
+    def get_dogesmartx_expertise(operation_type: str) -> Tuple[str, ...]:
         """Get DogeSmartX-specific expertise for the operation type."""
-        expertise_map = {
-            "atomic_swap": [
-                "Cross-chain atomic swaps between ETH and DOGE",
-                "HTLC (Hash Time-Locked Contract) implementation",
-                "Sepolia testnet integration with real Web3 connectivity",
-                "Enhanced Dogecoin HTLC with realistic OP codes",
-                "Cryptographic secret generation and management",
-                "Timelock-based refund mechanisms",
-                "Real transaction deployment capabilities"
-            ],
-            "contract_deployment": [
-                "Real HTLC smart contract deployment on Sepolia testnet",
-                "Solidity contract compilation and bytecode generation",
-                "Gas estimation and optimization strategies",
-                "Web3 transaction signing and broadcasting",
-                "Contract interaction and state management",
-                "Etherscan integration for transaction monitoring",
-                "Multi-RPC endpoint failover for reliability"
-            ],
-            "wallet_setup": [
-                "Dual-chain wallet initialization (ETH + DOGE)",
-                "Sepolia testnet wallet creation with real keys",
-                "Dogecoin testnet integration with bitcoinlib",
-                "Funded wallet balance verification and management",
-                "Cross-chain address generation and validation",
-                "Secure key storage and management practices",
-                "Network connectivity testing and optimization"
-            ],
-            "test_execution": [
-                "Comprehensive test suite for all DogeSmartX features",
-                "Atomic swap parameter validation testing",
-                "HTLC deployment simulation and verification",
-                "Security feature testing and validation",
-                "Error handling and edge case testing",
-                "Performance testing and optimization",
-                "Integration testing with real testnet networks"
-            ]
-        }
-        
-        return expertise_map.get(operation_type, [
-            "DogeSmartX cross-chain DeFi operations",
-            "Real atomic swap implementation",
-            "Testnet integration and testing",
-            "Secure cryptographic operations"
-        ])
+        return _EXPERTISE_MAP.get(operation_type, _DEFAULT_EXPERTISE)
 
     @staticmethod
-    def get_operation_guidance(operation_type: str) -> list:
+    def get_operation_guidance(operation_type: str) -> Tuple[str, ...]:
         """Get step-by-step guidance for DogeSmartX operations."""
-        guidance_map = {
-            "atomic_swap": [
-                "1. Specify your DeFi operation (swap ETH ↔ DOGE)",
-                "2. Configure swap amounts and recipient addresses", 
-                "3. Execute atomic swap with HTLC deployment",
-                "4. Monitor swap progress and claim funds"
-            ],
-            "contract_deployment": [
-                "1. Configure Sepolia testnet connection",
-                "2. Prepare HTLC contract parameters",
-                "3. Deploy contract with gas optimization",
-                "4. Verify deployment on Etherscan"
-            ],
-            "wallet_setup": [
-                "1. Initialize dual-chain wallet system",
-                "2. Connect to Sepolia and Dogecoin testnets",
-                "3. Verify wallet balances and connectivity",
-                "4. Test cross-chain operations"
-            ],
-            "test_execution": [
-                "1. Run comprehensive test suite",
-                "2. Validate all core functionalities",
-                "3. Check security and error handling",
-                "4. Confirm system readiness"
-            ]
-        }
-        
-        return guidance_map.get(operation_type, [
-            "1. Specify your DeFi operation (swap, deploy, test)",
-            "2. Configure testnet settings", 
-            "3. Execute operation with monitoring",
-            "4. Validate results and security"
-        ])
+        return _GUIDANCE_MAP.get(operation_type, _DEFAULT_GUIDANCE)